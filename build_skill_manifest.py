@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Skill Manifest Builder
+---------------------
+This script scans the skills package once and writes skills/_manifest.py,
+which lists every BaseSkill subclass so the registry can discover skills
+without listing the directory or introspecting modules at runtime.
+
+Run it again whenever a skill module is added, renamed or removed.
+"""
+
+import os
+import ast
+import argparse
+from typing import List, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SKILLS_DIR = os.path.join(BASE_DIR, 'skills')
+
+# Modules in the skills package that never define concrete skills
+EXCLUDED_MODULES = {'__init__.py', '_manifest.py', 'base_skill.py', 'skill_registry.py'}
+
+MANIFEST_HEADER = '''"""
+Skill Manifest for Agent Garden
+------------------------------
+Generated by build_skill_manifest.py; do not edit by hand.
+"""
+
+'''
+
+def find_skill_classes(skills_dir: str = SKILLS_DIR) -> List[Tuple[str, str]]:
+    """
+    Find classes that directly subclass BaseSkill, without importing any module.
+
+    Args:
+        skills_dir: Directory of the skills package
+
+    Returns:
+        Sorted list of (module path, class name) pairs
+    """
+    entries = []
+    for filename in sorted(os.listdir(skills_dir)):
+        if not filename.endswith('.py') or filename in EXCLUDED_MODULES:
+            continue
+
+        with open(os.path.join(skills_dir, filename), 'r') as f:
+            tree = ast.parse(f.read(), filename=filename)
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for base in node.bases:
+                base_name = base.attr if isinstance(base, ast.Attribute) else getattr(base, 'id', None)
+                if base_name == 'BaseSkill':
+                    entries.append((f"skills.{filename[:-3]}", node.name))
+                    break
+
+    return entries
+
+def render_manifest(entries: List[Tuple[str, str]]) -> str:
+    """
+    Render the manifest module source.
+
+    Args:
+        entries: (module path, class name) pairs
+
+    Returns:
+        Python source for skills/_manifest.py
+    """
+    lines = [MANIFEST_HEADER, "# (module path, class name) of every skill class\n", "SKILL_MANIFEST = (\n"]
+    lines.extend(f"    ({module!r}, {class_name!r}),\n" for module, class_name in entries)
+    lines.append(")\n")
+    return "".join(lines)
+
+def main():
+    """Main entry point for the manifest builder."""
+    parser = argparse.ArgumentParser(description="Generate skills/_manifest.py")
+    parser.add_argument("--check", action="store_true", help="Exit with an error if the manifest is out of date")
+    args = parser.parse_args()
+
+    manifest_path = os.path.join(SKILLS_DIR, '_manifest.py')
+    source = render_manifest(find_skill_classes())
+
+    if args.check:
+        current = ""
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as f:
+                current = f.read()
+        if current != source:
+            print(f"{manifest_path} is out of date; run build_skill_manifest.py")
+            raise SystemExit(1)
+        print(f"{manifest_path} is up to date")
+        return
+
+    with open(manifest_path, 'w') as f:
+        f.write(source)
+    print(f"Wrote {manifest_path}")
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ from helpers import email_helper, memory_helper, backup_helper, task_prioritizer
 from helpers import agent_framework, agent_communication, lifecycle_manager
 from skills import skill_registry
 from perception import PerceptionManager, NewsSource, ApiSource
+from perception import manager as perception_manager
 
 # Default paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import smtplib
 from email.message import EmailMessage
 from dotenv import load_dotenv
@@ -24,3 +25,11 @@ def send_email(recipient, subject, body):
         server.login(SMTP_USER, SMTP_PASS)
         server.send_message(msg)
     print(f"Email sent to {recipient}")
+
+async def send_email_async(recipient, subject, body):
+    # smtplib blocks on network round trips, so run each send in a worker thread
+    await asyncio.to_thread(send_email, recipient, subject, body)
+
+async def send_emails_async(recipients, subject, body):
+    # Overlap the sends so total time is the slowest send rather than the sum
+    await asyncio.gather(*(send_email_async(r, subject, body) for r in recipients))
@@ -0,0 +1,110 @@
+"""
+Logging Helper
+-------------
+Buffered logging setup shared by the long-running garden scripts.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import List
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Active listener and buffered handlers, drained by stop_buffered_logging()
+_listener = None
+_handlers: List[logging.Handler] = []
+
+def start_buffered_logging(log_file: str, level: int = logging.INFO, capacity: int = 256) -> None:
+    """
+    Route root logging through a queue to a background thread that batches file writes.
+
+    Records are written to the console as they arrive and buffered in memory for the
+    log file, which is flushed every `capacity` records, on ERROR or above, and at exit.
+
+    Args:
+        log_file: Path of the log file to append to
+        level: Root logger level
+        capacity: Number of records to buffer before writing to the log file
+    """
+    global _listener
+
+    # Leave an existing logging configuration alone, as basicConfig would
+    if _listener is not None or logging.getLogger().handlers:
+        return
+
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity, flushLevel=logging.ERROR, target=file_handler
+    )
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    # The queue side only merges args into the message; the listener's handlers format it
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+    _handlers.extend([memory_handler, file_handler, stream_handler])
+    _listener = logging.handlers.QueueListener(log_queue, memory_handler, stream_handler)
+    _listener.start()
+    atexit.register(stop_buffered_logging)
+
+def stop_buffered_logging() -> None:
+    """Drain queued records and flush buffered log output. Safe to call more than once."""
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
+    # The memory handler flushes into the file handler when closed
+    for handler in _handlers:
+        handler.close()
+    _handlers.clear()
+
+def start_worker_logging(log_queue, level: int = logging.INFO) -> None:
+    """
+    Send this process's log records to the parent process through a multiprocessing queue.
+
+    Meant as a process pool initializer. Pool workers never run atexit hooks, so any
+    buffered logging set up when the worker imported the main module is replaced.
+
+    Args:
+        log_queue: multiprocessing queue read by forward_worker_logging() in the parent
+        level: Root logger level in the worker
+    """
+    stop_buffered_logging()
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+def forward_worker_logging(log_queue) -> logging.handlers.QueueListener:
+    """
+    Hand records sent by start_worker_logging() to this process's root handlers.
+
+    Args:
+        log_queue: multiprocessing queue the workers log to
+
+    Returns:
+        The started listener; stop it once the workers have finished
+    """
+    listener = logging.handlers.QueueListener(log_queue, *logging.getLogger().handlers,
+                                              respect_handler_level=True)
+    listener.start()
+    return listener
@@ -9,14 +9,239 @@ import logging
 import random
 import requests
 import json
-from typing import Dict, List, Any
-from datetime import datetime, timedelta
+import functools
+import time
+from typing import Dict, List, Any, Optional
+from datetime import datetime
 from .perception_manager import PerceptionSource
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pre-bound helpers for the simulators' hot loops
+_random = random.random
+_uniform = random.uniform
+_choice = random.choice
+_randint = random.randint
+_utcnow = datetime.utcnow
+
+# Cache location, created once at import
+_CACHE_DIR = os.path.join("perception", "cache")
+_CACHE_FILE = os.path.join(_CACHE_DIR, "api_cache.json")
+os.makedirs(_CACHE_DIR, exist_ok=True)
+
+# How long simulated API data stays fresh
+_CACHE_TTL_SECONDS = 3600
+
+# Consecutive failures before an endpoint's circuit opens, and the
+# longest it stays open
+_BREAKER_THRESHOLD = 3
+_BREAKER_MAX_SECONDS = 3600
+
+# Maximum number of response bytes read from an endpoint
+MAX_RESPONSE_BYTES = 1 << 20
+
+# HTTP response code ranges and their status labels
+_BUCKETS = (
+    (200, 300, "healthy"),
+    (300, 400, "redirect"),
+    (400, 500, "client_error"),
+    (500, 600, "server_error")
+)
+
+# Status label for every HTTP response code, indexed by code
+_CODE_TO_STATUS = tuple(
+    next((label for low, high, label in _BUCKETS if low <= code < high), "unknown")
+    for code in range(600)
+)
+
+def _classify(code: int) -> str:
+    """Return the status label for an HTTP response code."""
+    return _CODE_TO_STATUS[code] if 0 <= code < 600 else "unknown"
+
+# Simulated financial API endpoints
+_FINANCIAL_ENDPOINTS = (
+    {"name": "financial_inclusion_metrics", "url": "https://api.example.com/financial-inclusion"},
+    {"name": "banking_access_index", "url": "https://api.example.com/banking-access"},
+    {"name": "credit_availability", "url": "https://api.example.com/credit-availability"}
+)
+
+# Simulated AI ethics API endpoints
+_AI_ETHICS_ENDPOINTS = (
+    {"name": "ai_bias_metrics", "url": "https://api.example.com/ai-bias"},
+    {"name": "model_transparency_index", "url": "https://api.example.com/transparency"}
+)
+
+# Simulated system monitoring endpoints
+_SYSTEM_ENDPOINTS = (
+    {"name": "system_health", "url": "https://api.example.com/health"},
+    {"name": "api_status", "url": "https://api.example.com/status"}
+)
+
+_SIMULATED_ENDPOINTS = _FINANCIAL_ENDPOINTS + _AI_ETHICS_ENDPOINTS + _SYSTEM_ENDPOINTS
+
+# Simulated endpoint name -> kind of payload it returns
+_NAME_TO_KIND = {
+    **{endpoint["name"]: "financial" for endpoint in _FINANCIAL_ENDPOINTS},
+    **{endpoint["name"]: "ai_ethics" for endpoint in _AI_ETHICS_ENDPOINTS},
+    **{endpoint["name"]: "system" for endpoint in _SYSTEM_ENDPOINTS}
+}
+
+# Simulated payload schemas. Each entry is (path, low, high, ndigits) for a
+# rounded uniform value, (path, options) for a random choice, or
+# (path, value) for a constant.
+_FIN_TEMPLATE = (
+    (("financial_inclusion_index",), 0.5, 0.8, 2),
+    (("metrics", "account_ownership", "overall"), 60, 80, 1),
+    (("metrics", "account_ownership", "urban"), 70, 90, 1),
+    (("metrics", "account_ownership", "rural"), 40, 70, 1),
+    (("metrics", "account_ownership", "trend"), ("increasing", "stable", "increasing")),
+    (("metrics", "digital_payments", "overall"), 50, 75, 1),
+    (("metrics", "digital_payments", "urban"), 60, 85, 1),
+    (("metrics", "digital_payments", "rural"), 30, 65, 1),
+    (("metrics", "digital_payments", "trend"), ("rapidly_increasing", "increasing", "stable")),
+    (("metrics", "credit_access", "overall"), 40, 65, 1),
+    (("metrics", "credit_access", "urban"), 50, 75, 1),
+    (("metrics", "credit_access", "rural"), 20, 55, 1),
+    (("metrics", "credit_access", "trend"), ("increasing", "stable", "increasing")),
+    (("regional_data", "north_america"), 0.8, 0.95, 2),
+    (("regional_data", "europe"), 0.75, 0.9, 2),
+    (("regional_data", "asia_pacific"), 0.5, 0.8, 2),
+    (("regional_data", "latin_america"), 0.4, 0.7, 2),
+    (("regional_data", "africa"), 0.3, 0.6, 2),
+)
+
+_AI_ETHICS_TEMPLATE = (
+    (("bias_metrics", "gender_bias_score"), 0.1, 0.4, 2),
+    (("bias_metrics", "racial_bias_score"), 0.15, 0.45, 2),
+    (("bias_metrics", "age_bias_score"), 0.1, 0.3, 2),
+    (("bias_metrics", "overall_bias_score"), 0.1, 0.4, 2),
+    (("transparency_metrics", "explainability_score"), 0.5, 0.9, 2),
+    (("transparency_metrics", "documentation_score"), 0.6, 0.95, 2),
+    (("transparency_metrics", "audit_readiness_score"), 0.4, 0.85, 2),
+    (("transparency_metrics", "overall_transparency_score"), 0.5, 0.9, 2),
+    (("industry_benchmarks", "finance_sector"), 0.5, 0.8, 2),
+    (("industry_benchmarks", "healthcare_sector"), 0.6, 0.85, 2),
+    (("industry_benchmarks", "education_sector"), 0.55, 0.75, 2),
+    (("industry_benchmarks", "retail_sector"), 0.4, 0.7, 2),
+    (("trend_data", "bias_trend"), ("improving", "stable", "improving")),
+    (("trend_data", "transparency_trend"), ("rapidly_improving", "improving", "stable")),
+    (("trend_data", "industry_adoption_trend"), ("increasing", "rapidly_increasing", "increasing")),
+)
+
+_SYSTEM_TEMPLATE = (
+    (("status",), "healthy"),
+    (("uptime",), None),  # filled in by _simulate_system_data
+    (("response_time", "p50"), 50, 150, 1),
+    (("response_time", "p90"), 150, 300, 1),
+    (("response_time", "p99"), 300, 600, 1),
+    (("error_rate",), 0.001, 0.01, 4),
+    (("resource_utilization", "cpu"), 20, 70, 1),
+    (("resource_utilization", "memory"), 30, 80, 1),
+    (("resource_utilization", "disk"), 40, 75, 1),
+    (("service_health", "api_gateway"), "healthy"),
+    (("service_health", "database"), "healthy"),
+    (("service_health", "authentication"), "healthy"),
+    (("service_health", "processing_engine"), ("healthy", "healthy", "degraded")),
+    (("service_health", "notification_service"), ("healthy", "healthy", "healthy", "degraded")),
+)
+
+def _fill_template(template) -> Dict[str, Any]:
+    """Build a fresh nested payload from a simulated payload schema."""
+    out = {}
+    for path, *spec in template:
+        node = out
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        if len(spec) == 3:
+            low, high, ndigits = spec
+            node[path[-1]] = round(_uniform(low, high), ndigits)
+        elif isinstance(spec[0], tuple):
+            node[path[-1]] = _choice(spec[0])
+        else:
+            node[path[-1]] = spec[0]
+    return out
+
+def _write_json_atomic(path: str, payload: Dict[str, Any]) -> None:
+    """Write JSON to a temp file and swap it in so readers never see a partial file."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps(payload))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+@functools.lru_cache(maxsize=8)
+def _load_endpoints_cached(path: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """Parse an endpoints file; keyed on mtime so edits are picked up."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+class EndpointResult:
+    """Result of polling a single API endpoint."""
+    
+    __slots__ = ("response_code", "response_time_ms", "data", "error", "timestamp", "status")
+    
+    def __init__(self, timestamp: str, response_code: Optional[int] = None,
+                 response_time_ms: Optional[float] = None, data: Any = None,
+                 error: Optional[str] = None):
+        """
+        Initialize an endpoint result.
+        
+        Args:
+            timestamp: When the endpoint was polled (ISO format)
+            response_code: HTTP status code, if a response was received
+            response_time_ms: Response latency in milliseconds
+            data: Parsed response payload
+            error: Error message if the request failed
+        """
+        self.response_code = response_code
+        self.response_time_ms = response_time_ms
+        self.data = data
+        self.error = error
+        self.timestamp = timestamp
+        self.status = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to a dictionary, omitting unset fields.
+        
+        Returns:
+            Dict representation of the result
+        """
+        result = {}
+        for field in self.__slots__:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = value
+        return result
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EndpointResult':
+        """
+        Create a result from a dictionary.
+        
+        Args:
+            data: Dictionary containing result data
+            
+        Returns:
+            An endpoint result
+        """
+        result = cls(
+            timestamp=data.get("timestamp"),
+            response_code=data.get("response_code"),
+            response_time_ms=data.get("response_time_ms"),
+            data=data.get("data"),
+            error=data.get("error")
+        )
+        result.status = data.get("status")
+        return result
+
+
 class ApiSource(PerceptionSource):
     """Perception source for external APIs."""
     
@@ -24,10 +249,9 @@ class ApiSource(PerceptionSource):
         """Initialize the API source."""
         super().__init__(name, description, frequency_minutes)
         self.endpoints = self._load_endpoints()
-        self.cache_file = os.path.join("perception", "cache", "api_cache.json")
-        
-        # Create cache directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        self.cache_file = _CACHE_FILE
+        self._mem_cache = None  # (expires_monotonic, payload)
+        self._breaker = {}  # endpoint name -> (consecutive_failures, open_until_monotonic)
     
     def perceive(self) -> Dict[str, Any]:
         """
@@ -56,33 +280,24 @@ class ApiSource(PerceptionSource):
         api_data = data.get("api_data", {})
         
         # Add status indicators
-        for endpoint, endpoint_data in api_data.items():
+        for result in api_data.values():
             # Add status based on response code or error
-            if "error" in endpoint_data:
-                endpoint_data["status"] = "error"
-            elif "response_code" in endpoint_data:
-                code = endpoint_data["response_code"]
-                if 200 <= code < 300:
-                    endpoint_data["status"] = "healthy"
-                elif 300 <= code < 400:
-                    endpoint_data["status"] = "redirect"
-                elif 400 <= code < 500:
-                    endpoint_data["status"] = "client_error"
-                else:
-                    endpoint_data["status"] = "server_error"
-            else:
-                endpoint_data["status"] = "unknown"
+            result.status = (
+                "error" if result.error is not None else
+                _classify(result.response_code) if result.response_code is not None else
+                "unknown"
+            )
         
         # Add summary statistics
-        healthy_count = sum(1 for _, data in api_data.items() if data.get("status") == "healthy")
-        error_count = sum(1 for _, data in api_data.items() if data.get("status") in ["client_error", "server_error", "error"])
+        healthy_count = sum(1 for result in api_data.values() if result.status == "healthy")
+        error_count = sum(1 for result in api_data.values() if result.status in ["client_error", "server_error", "error"])
         
         # Generate insights
         insights = self._generate_insights(api_data)
         
         return {
             "timestamp": datetime.utcnow().isoformat(),
-            "api_data": api_data,
+            "api_data": {name: result.to_dict() for name, result in api_data.items()},
             "summary": {
                 "total_endpoints": len(api_data),
                 "healthy_endpoints": healthy_count,
@@ -103,8 +318,8 @@ class ApiSource(PerceptionSource):
         endpoints_file = os.path.join("config", "api_endpoints.json")
         if os.path.exists(endpoints_file):
             try:
-                with open(endpoints_file, 'r') as f:
-                    return json.load(f)
+                mtime_ns = os.stat(endpoints_file).st_mtime_ns
+                return list(_load_endpoints_cached(endpoints_file, mtime_ns))
             except Exception as e:
                 logger.error(f"Error loading API endpoints: {str(e)}")
         
@@ -128,37 +343,68 @@ class ApiSource(PerceptionSource):
             params = endpoint.get("params", {})
             timeout = endpoint.get("timeout", 10)
             
+            # Skip endpoints whose circuit is open after repeated failures
+            failures, open_until = self._breaker.get(name, (0, 0))
+            if time.monotonic() < open_until:
+                api_data[name] = EndpointResult(
+                    timestamp=datetime.utcnow().isoformat(),
+                    error="circuit open"
+                )
+                continue
+            
             try:
                 logger.info(f"Fetching API data from: {url}")
                 
                 if method == "GET":
-                    response = requests.get(url, headers=headers, params=params, timeout=timeout)
+                    response = requests.get(url, headers=headers, params=params, timeout=timeout, stream=True)
                 elif method == "POST":
                     data = endpoint.get("data", {})
-                    response = requests.post(url, headers=headers, params=params, json=data, timeout=timeout)
+                    response = requests.post(url, headers=headers, params=params, json=data, timeout=timeout, stream=True)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
                 
+                # Read at most MAX_RESPONSE_BYTES so oversized bodies are never buffered
+                with response:
+                    body = response.raw.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
+                
+                if len(body) > MAX_RESPONSE_BYTES:
+                    api_data[name] = EndpointResult(
+                        timestamp=datetime.utcnow().isoformat(),
+                        response_code=response.status_code,
+                        error="response too large"
+                    )
+                    continue
+                
                 # Parse response based on content type
                 content_type = response.headers.get("Content-Type", "")
                 if "application/json" in content_type:
-                    response_data = response.json()
+                    response_data = json.loads(body)
                 else:
-                    response_data = {"text": response.text[:1000]}  # Limit text size
+                    text = body.decode(response.encoding or "utf-8", errors="replace")
+                    response_data = {"text": text[:1000]}  # Limit text size
                 
-                api_data[name] = {
-                    "response_code": response.status_code,
-                    "response_time_ms": response.elapsed.total_seconds() * 1000,
-                    "data": response_data,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                api_data[name] = EndpointResult(
+                    timestamp=datetime.utcnow().isoformat(),
+                    response_code=response.status_code,
+                    response_time_ms=response.elapsed.total_seconds() * 1000,
+                    data=response_data
+                )
+                self._breaker.pop(name, None)
                 
             except Exception as e:
                 logger.error(f"Error fetching API data from {url}: {str(e)}")
-                api_data[name] = {
-                    "error": str(e),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                api_data[name] = EndpointResult(
+                    timestamp=datetime.utcnow().isoformat(),
+                    error=str(e)
+                )
+                
+                # Back off exponentially once the failure threshold is reached
+                failures += 1
+                open_until = 0
+                if failures >= _BREAKER_THRESHOLD:
+                    open_until = time.monotonic() + min(_BREAKER_MAX_SECONDS, 60 * 2 ** failures)
+                    logger.warning(f"Circuit opened for {name} after {failures} consecutive failures")
+                self._breaker[name] = (failures, open_until)
         
         return {"api_data": api_data}
     
@@ -169,6 +415,10 @@ class ApiSource(PerceptionSource):
         Returns:
             Dict containing simulated API data
         """
+        # Serve from memory while the last result is still fresh
+        if self._mem_cache and time.monotonic() < self._mem_cache[0]:
+            return self._mem_cache[1]
+        
         # Check if we have cached data
         if os.path.exists(self.cache_file):
             try:
@@ -176,8 +426,14 @@ class ApiSource(PerceptionSource):
                     cached_data = json.load(f)
                     
                 # Only use cache if it's less than an hour old
-                cache_time = datetime.fromisoformat(cached_data.get("timestamp", "2000-01-01T00:00:00"))
-                if datetime.utcnow() - cache_time < timedelta(hours=1):
+                cache_age = time.time() - cached_data.get("epoch", 0)
+                if cache_age < _CACHE_TTL_SECONDS:
+                    cached_data["api_data"] = {
+                        name: EndpointResult.from_dict(endpoint_data)
+                        for name, endpoint_data in cached_data.get("api_data", {}).items()
+                    }
+                    remaining = _CACHE_TTL_SECONDS - cache_age
+                    self._mem_cache = (time.monotonic() + remaining, cached_data)
                     return cached_data
             except Exception as e:
                 logger.error(f"Error reading API cache: {str(e)}")
@@ -185,58 +441,37 @@ class ApiSource(PerceptionSource):
         # Generate simulated API data
         api_data = {}
         
-        # Simulated financial API endpoints
-        financial_endpoints = [
-            {"name": "financial_inclusion_metrics", "url": "https://api.example.com/financial-inclusion"},
-            {"name": "banking_access_index", "url": "https://api.example.com/banking-access"},
-            {"name": "credit_availability", "url": "https://api.example.com/credit-availability"}
-        ]
-        
-        # Simulated AI ethics API endpoints
-        ai_ethics_endpoints = [
-            {"name": "ai_bias_metrics", "url": "https://api.example.com/ai-bias"},
-            {"name": "model_transparency_index", "url": "https://api.example.com/transparency"}
-        ]
-        
-        # Simulated system monitoring endpoints
-        system_endpoints = [
-            {"name": "system_health", "url": "https://api.example.com/health"},
-            {"name": "api_status", "url": "https://api.example.com/status"}
-        ]
-        
-        # Combine all endpoints
-        all_endpoints = financial_endpoints + ai_ethics_endpoints + system_endpoints
-        
-        for endpoint in all_endpoints:
+        # Bind simulators to their endpoint kinds
+        simulators = {
+            "financial": self._simulate_financial_data,
+            "ai_ethics": self._simulate_ai_ethics_data,
+            "system": self._simulate_system_data
+        }
+        
+        for endpoint in _SIMULATED_ENDPOINTS:
             name = endpoint["name"]
             
             # Simulate success or failure (90% success rate)
-            success = random.random() < 0.9
+            success = _random() < 0.9
             
             if success:
                 # Simulate successful response
-                response_code = random.choice([200, 200, 200, 201, 204])  # Mostly 200 OK
-                response_time = random.uniform(50, 500)  # 50-500ms
+                response_code = _choice([200, 200, 200, 201, 204])  # Mostly 200 OK
+                response_time = _uniform(50, 500)  # 50-500ms
                 
                 # Generate simulated data based on endpoint type
-                if "financial" in name or "banking" in name or "credit" in name:
-                    data = self._simulate_financial_data()
-                elif "ai" in name or "bias" in name or "model" in name:
-                    data = self._simulate_ai_ethics_data()
-                elif "system" in name or "health" in name or "status" in name:
-                    data = self._simulate_system_data()
-                else:
-                    data = {"message": "Data available"}
+                simulate = simulators.get(_NAME_TO_KIND.get(name))
+                data = simulate() if simulate else {"message": "Data available"}
                 
-                api_data[name] = {
-                    "response_code": response_code,
-                    "response_time_ms": response_time,
-                    "data": data,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                api_data[name] = EndpointResult(
+                    timestamp=_utcnow().isoformat(),
+                    response_code=response_code,
+                    response_time_ms=response_time,
+                    data=data
+                )
             else:
                 # Simulate error response
-                error_code = random.choice([400, 401, 403, 404, 500, 502, 503])
+                error_code = _choice([400, 401, 403, 404, 500, 502, 503])
                 error_messages = {
                     400: "Bad Request",
                     401: "Unauthorized",
@@ -247,22 +482,26 @@ class ApiSource(PerceptionSource):
                     503: "Service Unavailable"
                 }
                 
-                api_data[name] = {
-                    "response_code": error_code,
-                    "error": error_messages.get(error_code, "Unknown Error"),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                api_data[name] = EndpointResult(
+                    timestamp=_utcnow().isoformat(),
+                    response_code=error_code,
+                    error=error_messages.get(error_code, "Unknown Error")
+                )
         
         result = {"api_data": api_data}
         
         # Cache the result
         try:
-            result["timestamp"] = datetime.utcnow().isoformat()
-            with open(self.cache_file, 'w') as f:
-                json.dump(result, f)
+            result["timestamp"] = _utcnow().isoformat()
+            result["epoch"] = int(time.time())
+            _write_json_atomic(self.cache_file, {
+                **result,
+                "api_data": {name: endpoint_result.to_dict() for name, endpoint_result in api_data.items()}
+            })
         except Exception as e:
             logger.error(f"Error writing API cache: {str(e)}")
         
+        self._mem_cache = (time.monotonic() + _CACHE_TTL_SECONDS, result)
         return result
     
     def _simulate_financial_data(self) -> Dict[str, Any]:
@@ -272,36 +511,7 @@ class ApiSource(PerceptionSource):
         Returns:
             Dict containing simulated financial data
         """
-        return {
-            "financial_inclusion_index": round(random.uniform(0.5, 0.8), 2),
-            "metrics": {
-                "account_ownership": {
-                    "overall": round(random.uniform(60, 80), 1),
-                    "urban": round(random.uniform(70, 90), 1),
-                    "rural": round(random.uniform(40, 70), 1),
-                    "trend": random.choice(["increasing", "stable", "increasing"])
-                },
-                "digital_payments": {
-                    "overall": round(random.uniform(50, 75), 1),
-                    "urban": round(random.uniform(60, 85), 1),
-                    "rural": round(random.uniform(30, 65), 1),
-                    "trend": random.choice(["rapidly_increasing", "increasing", "stable"])
-                },
-                "credit_access": {
-                    "overall": round(random.uniform(40, 65), 1),
-                    "urban": round(random.uniform(50, 75), 1),
-                    "rural": round(random.uniform(20, 55), 1),
-                    "trend": random.choice(["increasing", "stable", "increasing"])
-                }
-            },
-            "regional_data": {
-                "north_america": round(random.uniform(0.8, 0.95), 2),
-                "europe": round(random.uniform(0.75, 0.9), 2),
-                "asia_pacific": round(random.uniform(0.5, 0.8), 2),
-                "latin_america": round(random.uniform(0.4, 0.7), 2),
-                "africa": round(random.uniform(0.3, 0.6), 2)
-            }
-        }
+        return _fill_template(_FIN_TEMPLATE)
     
     def _simulate_ai_ethics_data(self) -> Dict[str, Any]:
         """
@@ -310,31 +520,7 @@ class ApiSource(PerceptionSource):
         Returns:
             Dict containing simulated AI ethics data
         """
-        return {
-            "bias_metrics": {
-                "gender_bias_score": round(random.uniform(0.1, 0.4), 2),
-                "racial_bias_score": round(random.uniform(0.15, 0.45), 2),
-                "age_bias_score": round(random.uniform(0.1, 0.3), 2),
-                "overall_bias_score": round(random.uniform(0.1, 0.4), 2)
-            },
-            "transparency_metrics": {
-                "explainability_score": round(random.uniform(0.5, 0.9), 2),
-                "documentation_score": round(random.uniform(0.6, 0.95), 2),
-                "audit_readiness_score": round(random.uniform(0.4, 0.85), 2),
-                "overall_transparency_score": round(random.uniform(0.5, 0.9), 2)
-            },
-            "industry_benchmarks": {
-                "finance_sector": round(random.uniform(0.5, 0.8), 2),
-                "healthcare_sector": round(random.uniform(0.6, 0.85), 2),
-                "education_sector": round(random.uniform(0.55, 0.75), 2),
-                "retail_sector": round(random.uniform(0.4, 0.7), 2)
-            },
-            "trend_data": {
-                "bias_trend": random.choice(["improving", "stable", "improving"]),
-                "transparency_trend": random.choice(["rapidly_improving", "improving", "stable"]),
-                "industry_adoption_trend": random.choice(["increasing", "rapidly_increasing", "increasing"])
-            }
-        }
+        return _fill_template(_AI_ETHICS_TEMPLATE)
     
     def _simulate_system_data(self) -> Dict[str, Any]:
         """
@@ -343,35 +529,16 @@ class ApiSource(PerceptionSource):
         Returns:
             Dict containing simulated system data
         """
-        return {
-            "status": "healthy",
-            "uptime": f"{random.randint(1, 30)} days, {random.randint(0, 23)} hours",
-            "response_time": {
-                "p50": round(random.uniform(50, 150), 1),
-                "p90": round(random.uniform(150, 300), 1),
-                "p99": round(random.uniform(300, 600), 1)
-            },
-            "error_rate": round(random.uniform(0.001, 0.01), 4),
-            "resource_utilization": {
-                "cpu": round(random.uniform(20, 70), 1),
-                "memory": round(random.uniform(30, 80), 1),
-                "disk": round(random.uniform(40, 75), 1)
-            },
-            "service_health": {
-                "api_gateway": "healthy",
-                "database": "healthy",
-                "authentication": "healthy",
-                "processing_engine": random.choice(["healthy", "healthy", "degraded"]),
-                "notification_service": random.choice(["healthy", "healthy", "healthy", "degraded"])
-            }
-        }
+        data = _fill_template(_SYSTEM_TEMPLATE)
+        data["uptime"] = f"{_randint(1, 30)} days, {_randint(0, 23)} hours"
+        return data
     
-    def _generate_insights(self, api_data: Dict[str, Any]) -> List[str]:
+    def _generate_insights(self, api_data: Dict[str, EndpointResult]) -> List[str]:
         """
         Generate insights from API data.
         
         Args:
-            api_data: The API data to analyze
+            api_data: Endpoint results keyed by endpoint name
             
         Returns:
             List of insights
@@ -383,7 +550,7 @@ class ApiSource(PerceptionSource):
         if total_endpoints == 0:
             return ["No API endpoints monitored"]
         
-        healthy_endpoints = sum(1 for _, data in api_data.items() if data.get("status") == "healthy")
+        healthy_endpoints = sum(1 for result in api_data.values() if result.status == "healthy")
         health_percentage = healthy_endpoints / total_endpoints * 100
         
         # Add health insight
@@ -398,8 +565,8 @@ class ApiSource(PerceptionSource):
         
         # Check for slow endpoints
         slow_endpoints = []
-        for name, data in api_data.items():
-            if "response_time_ms" in data and data["response_time_ms"] > 300:
+        for name, result in api_data.items():
+            if result.response_time_ms is not None and result.response_time_ms > 300:
                 slow_endpoints.append(name)
         
         if slow_endpoints:
@@ -411,11 +578,15 @@ class ApiSource(PerceptionSource):
                 insights.append(f"Multiple APIs ({len(slow_endpoints)}) are experiencing performance issues")
         
         # Add insights from specific API types
-        for name, data in api_data.items():
-            if "data" not in data:
+        for name, result in api_data.items():
+            # Stop scanning once enough insights have been collected
+            if len(insights) >= 5:
+                break
+            
+            if result.data is None:
                 continue
                 
-            api_data_content = data.get("data", {})
+            api_data_content = result.data
             
             # Financial insights
             if "financial_inclusion_index" in api_data_content:
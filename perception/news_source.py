@@ -5,10 +5,16 @@ This module provides a perception source for news articles.
 """
 
 import os
+import re
+import copy
 import logging
 import random
 import requests
 import json
+import time
+import functools
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 from .perception_manager import PerceptionSource
@@ -17,18 +23,133 @@ from .perception_manager import PerceptionSource
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Topics queried from the news API, one request each
+_NEWS_QUERIES = ("artificial intelligence", "financial inclusion", "ethics")
+
+# Title keyword groups used to pick simulated sources and descriptions
+_AI_RE = re.compile(r"\b(?:ai|artificial intelligence)\b")
+_FIN_RE = re.compile(r"\b(?:financial|banking|loan)\b")
+
+# Simulated news titles and descriptions, by keyword group
+_AI_TITLES = (
+    "New AI Ethics Framework Proposed by Leading Tech Companies",
+    "Study Shows Bias in AI Financial Systems Affecting Minority Groups",
+    "Open Source AI Models Gain Traction in Financial Sector",
+    "AI Regulation Bill Advances in Senate Committee",
+    "Tech Giants Pledge $1B for Responsible AI Development"
+)
+
+_FINANCE_TITLES = (
+    "Financial Inclusion Index Shows Progress in Developing Regions",
+    "Mobile Banking Adoption Reaches Record Levels in Rural Areas",
+    "New Microlending Platform Targets Underbanked Communities",
+    "Central Banks Explore Digital Currencies for Financial Inclusion",
+    "Report: Alternative Credit Scoring Improves Loan Access"
+)
+
+_ETHICS_TITLES = (
+    "Ethics in Technology: A New Framework for the Digital Age",
+    "Survey Reveals Growing Consumer Concern Over Data Privacy",
+    "Financial Institutions Adopt New Ethical Guidelines",
+    "Transparency in AI Decision-Making Becomes Industry Standard",
+    "Ethics Committees Now Required for AI Development in Healthcare"
+)
+
+_ALL_TITLES = _AI_TITLES + _FINANCE_TITLES + _ETHICS_TITLES
+
+_AI_DESCRIPTIONS = (
+    "Researchers have developed a new framework for ensuring AI systems operate ethically and transparently.",
+    "A recent study highlights concerning biases in AI algorithms used for financial decision-making.",
+    "Open source AI models are gaining popularity as financial institutions seek more transparent solutions.",
+    "Lawmakers are advancing legislation to regulate artificial intelligence applications in sensitive domains.",
+    "Major technology companies have announced a joint initiative to promote responsible AI development."
+)
+
+_FINANCE_DESCRIPTIONS = (
+    "The latest Financial Inclusion Index shows significant progress in expanding banking access globally.",
+    "Mobile banking adoption has reached unprecedented levels in previously underserved rural communities.",
+    "A new platform aims to connect underbanked individuals with microloans to build credit history.",
+    "Central banks worldwide are exploring digital currencies as a means to improve financial inclusion.",
+    "Alternative approaches to credit scoring are helping more people qualify for financial services."
+)
+
+_ETHICS_DESCRIPTIONS = (
+    "Industry leaders have collaborated on a new ethical framework for technology development and deployment.",
+    "A comprehensive survey reveals growing public concern regarding data privacy and algorithmic decision-making.",
+    "Financial institutions are implementing new ethical guidelines to ensure fair treatment of all customers.",
+    "Transparency in AI decision-making processes is becoming the expected standard across industries.",
+    "Healthcare organizations will now require ethics committee approval for AI implementation."
+)
+
+# Outlets credited for simulated articles, by title keyword group
+_AI_SOURCES = ("TechCrunch", "Wired", "MIT Technology Review", "The Verge")
+_FINANCE_SOURCES = ("Financial Times", "Bloomberg", "The Economist", "Wall Street Journal")
+_GENERAL_SOURCES = ("The Guardian", "New York Times", "Washington Post", "BBC")
+_SOURCES_BY_BUCKET = {"ai": _AI_SOURCES, "finance": _FINANCE_SOURCES, "ethics": _GENERAL_SOURCES}
+
+# Position of each overall sentiment in per-category sentiment counts
+_SENTIMENT_INDEX = {"positive": 0, "negative": 1, "neutral": 2}
+
+# How long simulated news stays fresh
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+@functools.lru_cache(maxsize=256)
+def _title_bucket(title: str) -> str:
+    """Classify a title into the "ai", "finance" or "ethics" keyword group."""
+    title_lc = title.lower()
+    if _AI_RE.search(title_lc):
+        return "ai"
+    elif _FIN_RE.search(title_lc):
+        return "finance"
+    else:
+        return "ethics"
+
+def _dump_json(payload: Any) -> bytes:
+    """Serialize a cache payload compactly, ready for a single write."""
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 class NewsSource(PerceptionSource):
     """Perception source for news articles."""
     
+    # Simple keyword-based categorization
+    CATEGORY_KEYWORDS = {
+        "technology": ["technology", "tech", "digital", "software", "hardware", "app"],
+        "business": ["business", "company", "industry", "market", "economic", "economy"],
+        "finance": ["finance", "banking", "loan", "credit", "investment", "financial"],
+        "ai": ["ai", "artificial intelligence", "machine learning", "algorithm", "neural", "model"],
+        "ethics": ["ethics", "ethical", "bias", "fairness", "responsible", "transparency"]
+    }
+    
+    # UTF-8 keyword -> category, and one pattern matching every keyword in a
+    # single scan over the encoded content (a byte scan avoids Unicode-width
+    # handling). The lookahead reports a hit at every offset so keywords
+    # nested in longer ones (e.g. "ai" in "fairness") are still found.
+    _KEYWORD_TO_CATEGORY = {
+        keyword.encode("utf-8"): category
+        for category, keywords in CATEGORY_KEYWORDS.items()
+        for keyword in keywords
+    }
+    _KEYWORD_RE = re.compile(
+        b"(?=(" + b"|".join(re.escape(k) for k in sorted(_KEYWORD_TO_CATEGORY, key=len, reverse=True)) + b"))"
+    )
+    
     def __init__(self, name: str = "news", description: str = "Monitors news articles", frequency_minutes: int = 120):
         """Initialize the news source."""
         super().__init__(name, description, frequency_minutes)
         self.categories = ["technology", "business", "finance", "ai", "ethics"]
         self.api_key = os.getenv("NEWS_API_KEY", "")
         self.cache_file = os.path.join("perception", "cache", "news_cache.json")
+        self.api_cache_file = os.path.join("perception", "cache", "news_api_cache.json")
         
         # Create cache directory if it doesn't exist
         os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        
+        # Last response and validators per query, for conditional requests
+        self._api_cache = self._load_api_cache() if self.api_key else {}
+        
+        # Reuse one connection pool (and TLS session) across polls
+        self._session = requests.Session()
+        self._session.headers.update({"X-Api-Key": self.api_key})
     
     def perceive(self) -> Dict[str, Any]:
         """
@@ -56,23 +177,41 @@ class NewsSource(PerceptionSource):
         """
         articles = data.get("articles", [])
         
-        # Add categories and sentiment analysis (simulated)
+        # Lowercase each article's text once for all keyword matching
+        for article in articles:
+            article["_lc"] = (article.get("title", "") + " " + article.get("description", "")).lower()
+        
+        # Add categories, sentiment and relevance (simulated) in a single pass,
+        # tallying categories and sentiment by category for trend detection;
+        # sentiment counts are [positive, negative, neutral] per category
+        category_counts = Counter()
+        sentiment_by_category = defaultdict(lambda: [0, 0, 0])
+        uniform = random.uniform
         for article in articles:
             # Assign categories
-            article["categories"] = self._categorize_article(article)
+            categories = self._categorize_article(article)
+            article["categories"] = categories
             
             # Simulate sentiment analysis
-            article["sentiment"] = self._analyze_sentiment(article)
+            sentiment = self._analyze_sentiment(article)
+            article["sentiment"] = sentiment
             
             # Add relevance score (simulated)
-            article["relevance_score"] = round(random.uniform(0.1, 1.0), 2)
+            article["relevance_score"] = round(uniform(0.1, 1.0), 2)
+            
+            del article["_lc"]
+            
+            sentiment_index = _SENTIMENT_INDEX[sentiment["overall"]]
+            for category in categories:
+                category_counts[category] += 1
+                sentiment_by_category[category][sentiment_index] += 1
+        
+        # Add summary of key trends
+        trends = self._trends_from_counts(category_counts, sentiment_by_category)
         
         # Sort by relevance
         articles.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
         
-        # Add summary of key trends
-        trends = self._identify_trends(articles)
-        
         return {
             "timestamp": datetime.utcnow().isoformat(),
             "articles": articles,
@@ -84,35 +223,118 @@ class NewsSource(PerceptionSource):
         """
         Fetch real news from a news API.
         
+        Each topic is queried concurrently and the results are merged,
+        dropping articles that appear under more than one topic.
+        
         Returns:
             Dict containing news articles
         """
+        with ThreadPoolExecutor(max_workers=len(_NEWS_QUERIES), thread_name_prefix="news") as pool:
+            responses = list(pool.map(self._fetch_news_query, _NEWS_QUERIES))
+        
+        self._save_api_cache()
+        
+        articles = []
+        seen_urls = set()
+        errors = []
+        for data in responses:
+            if "error" in data:
+                errors.append(data["error"])
+            for article in data.get("articles", []):
+                url = article.get("url")
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                articles.append(article)
+        
+        result = {"articles": articles}
+        if errors and not articles:
+            result["error"] = errors[0]
+        return result
+    
+    def _fetch_news_query(self, query: str) -> Dict[str, Any]:
+        """
+        Fetch news for a single query from a news API.
+        
+        Args:
+            query: The search query
+            
+        Returns:
+            Dict containing news articles, or an error message
+        """
         try:
             # Example using NewsAPI.org
             url = "https://newsapi.org/v2/everything"
             
-            # Create a query for AI and finance related news
             params = {
-                "q": "artificial intelligence OR financial inclusion OR ethics",
+                "q": query,
                 "sortBy": "publishedAt",
                 "language": "en",
-                "apiKey": self.api_key,
                 "pageSize": 10
             }
             
-            response = requests.get(url, params=params)
-            data = response.json()
+            # Revalidate the previous response instead of downloading it again
+            headers = {}
+            cached = self._api_cache.get(query)
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
+            response = self._session.get(url, params=params, headers=headers, timeout=10)
+            
+            if response.status_code == 304 and cached:
+                return copy.deepcopy(cached["data"])
+            
+            # Decode the raw body directly, skipping requests' charset sniffing
+            try:
+                data = json.loads(response.content)
+            except ValueError as e:
+                logger.error(f"Invalid JSON in news response for '{query}': {str(e)}")
+                return {"articles": [], "error": f"Invalid JSON response: {str(e)}"}
             
             if response.status_code == 200:
+                if response.headers.get("ETag") or response.headers.get("Last-Modified"):
+                    self._api_cache[query] = {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "data": copy.deepcopy(data)
+                    }
                 return data
             else:
-                logger.error(f"Error fetching news: {data.get('message', 'Unknown error')}")
+                logger.error(f"Error fetching news for '{query}': {data.get('message', 'Unknown error')}")
                 return {"articles": [], "error": data.get("message", "Unknown error")}
                 
         except Exception as e:
-            logger.error(f"Error fetching news: {str(e)}")
+            logger.error(f"Error fetching news for '{query}': {str(e)}")
             return {"articles": [], "error": str(e)}
     
+    def _load_api_cache(self) -> Dict[str, Any]:
+        """
+        Load cached news API responses and their validators.
+        
+        Returns:
+            Dict mapping each query to its cached response
+        """
+        if os.path.exists(self.api_cache_file):
+            try:
+                with open(self.api_cache_file, 'rb') as f:
+                    return json.loads(f.read())
+            except Exception as e:
+                logger.error(f"Error reading news API cache: {str(e)}")
+        return {}
+    
+    def _save_api_cache(self) -> None:
+        """Persist cached news API responses and their validators."""
+        if not self._api_cache:
+            return
+        try:
+            with open(self.api_cache_file, 'wb') as f:
+                f.write(_dump_json(self._api_cache))
+        except Exception as e:
+            logger.error(f"Error writing news API cache: {str(e)}")
+    
     def _simulate_news(self) -> Dict[str, Any]:
         """
         Simulate news articles when no API key is available.
@@ -120,64 +342,38 @@ class NewsSource(PerceptionSource):
         Returns:
             Dict containing simulated news articles
         """
-        # Check if we have cached news
+        # Check if we have cached news that is less than a day old. The file's
+        # mtime is checked first so a stale cache is never parsed; the embedded
+        # timestamp still decides, since checkouts and copies refresh the mtime
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r') as f:
-                    cached_data = json.load(f)
+                if time.time() - os.stat(self.cache_file).st_mtime < _CACHE_TTL_SECONDS:
+                    with open(self.cache_file, 'rb') as f:
+                        cached_data = json.loads(f.read())
                     
-                # Only use cache if it's less than a day old
-                cache_time = datetime.fromisoformat(cached_data.get("timestamp", "2000-01-01T00:00:00"))
-                if datetime.utcnow() - cache_time < timedelta(days=1):
-                    return cached_data
+                    cache_time = datetime.fromisoformat(cached_data.get("timestamp", "2000-01-01T00:00:00"))
+                    if datetime.utcnow() - cache_time < timedelta(seconds=_CACHE_TTL_SECONDS):
+                        return cached_data
             except Exception as e:
                 logger.error(f"Error reading news cache: {str(e)}")
         
         # Generate simulated news
         current_date = datetime.utcnow()
         
-        ai_titles = [
-            "New AI Ethics Framework Proposed by Leading Tech Companies",
-            "Study Shows Bias in AI Financial Systems Affecting Minority Groups",
-            "Open Source AI Models Gain Traction in Financial Sector",
-            "AI Regulation Bill Advances in Senate Committee",
-            "Tech Giants Pledge $1B for Responsible AI Development"
-        ]
+        # Pick 10 distinct titles at random
+        selected_titles = random.sample(_ALL_TITLES, 10)
         
-        finance_titles = [
-            "Financial Inclusion Index Shows Progress in Developing Regions",
-            "Mobile Banking Adoption Reaches Record Levels in Rural Areas",
-            "New Microlending Platform Targets Underbanked Communities",
-            "Central Banks Explore Digital Currencies for Financial Inclusion",
-            "Report: Alternative Credit Scoring Improves Loan Access"
-        ]
-        
-        ethics_titles = [
-            "Ethics in Technology: A New Framework for the Digital Age",
-            "Survey Reveals Growing Consumer Concern Over Data Privacy",
-            "Financial Institutions Adopt New Ethical Guidelines",
-            "Transparency in AI Decision-Making Becomes Industry Standard",
-            "Ethics Committees Now Required for AI Development in Healthcare"
-        ]
-        
-        # Combine all titles and generate articles
-        all_titles = ai_titles + finance_titles + ethics_titles
-        random.shuffle(all_titles)
+        # Draw a publication offset within the last week for every article up
+        # front (one draw covers both the day and the hour)
+        hours_ago = [random.randrange(7 * 24) for _ in selected_titles]
         
         articles = []
-        for i, title in enumerate(all_titles[:10]):  # Limit to 10 articles
-            # Generate a random date within the last week
-            days_ago = random.randint(0, 6)
-            hours_ago = random.randint(0, 23)
-            published_date = current_date - timedelta(days=days_ago, hours=hours_ago)
+        choice = random.choice
+        for i, title in enumerate(selected_titles):
+            published_date = current_date - timedelta(hours=hours_ago[i])
             
             # Determine source based on title
-            if any(term in title.lower() for term in ["ai", "artificial intelligence"]):
-                source = random.choice(["TechCrunch", "Wired", "MIT Technology Review", "The Verge"])
-            elif any(term in title.lower() for term in ["financial", "banking", "loan"]):
-                source = random.choice(["Financial Times", "Bloomberg", "The Economist", "Wall Street Journal"])
-            else:
-                source = random.choice(["The Guardian", "New York Times", "Washington Post", "BBC"])
+            source = choice(_SOURCES_BY_BUCKET[_title_bucket(title)])
             
             # Generate article
             article = {
@@ -195,8 +391,8 @@ class NewsSource(PerceptionSource):
         # Cache the result
         try:
             result["timestamp"] = datetime.utcnow().isoformat()
-            with open(self.cache_file, 'w') as f:
-                json.dump(result, f)
+            with open(self.cache_file, 'wb') as f:
+                f.write(_dump_json(result))
         except Exception as e:
             logger.error(f"Error writing news cache: {str(e)}")
         
@@ -212,37 +408,14 @@ class NewsSource(PerceptionSource):
         Returns:
             A simulated article description
         """
-        ai_descriptions = [
-            "Researchers have developed a new framework for ensuring AI systems operate ethically and transparently.",
-            "A recent study highlights concerning biases in AI algorithms used for financial decision-making.",
-            "Open source AI models are gaining popularity as financial institutions seek more transparent solutions.",
-            "Lawmakers are advancing legislation to regulate artificial intelligence applications in sensitive domains.",
-            "Major technology companies have announced a joint initiative to promote responsible AI development."
-        ]
-        
-        finance_descriptions = [
-            "The latest Financial Inclusion Index shows significant progress in expanding banking access globally.",
-            "Mobile banking adoption has reached unprecedented levels in previously underserved rural communities.",
-            "A new platform aims to connect underbanked individuals with microloans to build credit history.",
-            "Central banks worldwide are exploring digital currencies as a means to improve financial inclusion.",
-            "Alternative approaches to credit scoring are helping more people qualify for financial services."
-        ]
-        
-        ethics_descriptions = [
-            "Industry leaders have collaborated on a new ethical framework for technology development and deployment.",
-            "A comprehensive survey reveals growing public concern regarding data privacy and algorithmic decision-making.",
-            "Financial institutions are implementing new ethical guidelines to ensure fair treatment of all customers.",
-            "Transparency in AI decision-making processes is becoming the expected standard across industries.",
-            "Healthcare organizations will now require ethics committee approval for AI implementation."
-        ]
-        
         # Select description based on title keywords
-        if any(term in title.lower() for term in ["ai", "artificial intelligence"]):
-            return random.choice(ai_descriptions)
-        elif any(term in title.lower() for term in ["financial", "banking", "loan"]):
-            return random.choice(finance_descriptions)
+        bucket = _title_bucket(title)
+        if bucket == "ai":
+            return random.choice(_AI_DESCRIPTIONS)
+        elif bucket == "finance":
+            return random.choice(_FINANCE_DESCRIPTIONS)
         else:
-            return random.choice(ethics_descriptions)
+            return random.choice(_ETHICS_DESCRIPTIONS)
     
     def _categorize_article(self, article: Dict[str, Any]) -> List[str]:
         """
@@ -254,28 +427,19 @@ class NewsSource(PerceptionSource):
         Returns:
             List of categories
         """
-        title = article.get("title", "").lower()
-        description = article.get("description", "").lower()
-        content = title + " " + description
-        
-        categories = []
-        
-        # Simple keyword-based categorization
-        category_keywords = {
-            "technology": ["technology", "tech", "digital", "software", "hardware", "app"],
-            "business": ["business", "company", "industry", "market", "economic", "economy"],
-            "finance": ["finance", "banking", "loan", "credit", "investment", "financial"],
-            "ai": ["ai", "artificial intelligence", "machine learning", "algorithm", "neural", "model"],
-            "ethics": ["ethics", "ethical", "bias", "fairness", "responsible", "transparency"]
-        }
+        # Prefer the lowercased text cached by process_perception
+        content = article.get("_lc")
+        if content is None:
+            content = (article.get("title", "") + " " + article.get("description", "")).lower()
         
-        for category, keywords in category_keywords.items():
-            if any(keyword in content for keyword in keywords):
-                categories.append(category)
+        # Collect every category with a keyword in the content in one pass
+        content_b = content.encode("utf-8")
+        hits = {self._KEYWORD_TO_CATEGORY[match.group(1)] for match in self._KEYWORD_RE.finditer(content_b)}
+        categories = [category for category in self.CATEGORY_KEYWORDS if category in hits]
         
         # Ensure at least one category
         if not categories:
-            categories.append(random.choice(list(category_keywords.keys())))
+            categories.append(random.choice(list(self.CATEGORY_KEYWORDS)))
         
         return categories
     
@@ -312,50 +476,33 @@ class NewsSource(PerceptionSource):
             "overall": overall
         }
     
-    def _identify_trends(self, articles: List[Dict[str, Any]]) -> List[str]:
+    def _trends_from_counts(self, category_counts: Counter,
+                            sentiment_by_category: Dict[str, List[int]]) -> List[str]:
         """
-        Identify trends from a collection of articles.
+        Generate trend statements from precomputed category tallies.
         
         Args:
-            articles: List of articles to analyze
+            category_counts: Number of articles per category
+            sentiment_by_category: [positive, negative, neutral] counts per category
             
         Returns:
             List of identified trends
         """
-        # In a real implementation, this would use more sophisticated analysis
-        # For now, we'll use a simple approach based on categories and sentiment
-        
-        # Count categories
-        category_counts = {}
-        for article in articles:
-            for category in article.get("categories", []):
-                category_counts[category] = category_counts.get(category, 0) + 1
-        
-        # Count sentiment by category
-        sentiment_by_category = {}
-        for article in articles:
-            sentiment = article.get("sentiment", {}).get("overall", "neutral")
-            for category in article.get("categories", []):
-                if category not in sentiment_by_category:
-                    sentiment_by_category[category] = {"positive": 0, "negative": 0, "neutral": 0}
-                sentiment_by_category[category][sentiment] += 1
-        
         # Generate trend statements
         trends = []
         
         # Add category prevalence trends
-        sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
-        if sorted_categories:
-            top_category = sorted_categories[0][0]
+        if category_counts:
+            top_category = category_counts.most_common(1)[0][0]
             trends.append(f"Increased coverage of {top_category}-related news")
         
         # Add sentiment trends
-        for category, sentiments in sentiment_by_category.items():
-            total = sum(sentiments.values())
+        for category, (positive, negative, neutral) in sentiment_by_category.items():
+            total = positive + negative + neutral
             if total >= 3:  # Only consider categories with enough articles
-                if sentiments["positive"] / total > 0.6:
+                if positive / total > 0.6:
                     trends.append(f"Positive sentiment trend in {category} news")
-                elif sentiments["negative"] / total > 0.6:
+                elif negative / total > 0.6:
                     trends.append(f"Negative sentiment trend in {category} news")
         
         # Add some general trends
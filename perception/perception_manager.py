@@ -4,9 +4,11 @@ Perception Manager for Agent Garden
 This module manages perception sources and coordinates perception activities.
 """
 
+import heapq
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -14,6 +16,19 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Thread pool for updating sources in parallel, shared by every manager so that
+# managers created per run don't each leave idle worker threads behind
+_update_pool = None
+_update_pool_lock = threading.Lock()
+
+def _get_update_pool() -> ThreadPoolExecutor:
+    """Get the shared source update pool, creating it on first use."""
+    global _update_pool
+    with _update_pool_lock:
+        if _update_pool is None:
+            _update_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="perception")
+        return _update_pool
+
 class PerceptionSource:
     """Base class for all perception sources."""
     
@@ -30,7 +45,8 @@ class PerceptionSource:
         self.description = description
         self.frequency_minutes = frequency_minutes
         self.enabled = True
-        self.last_update = None
+        self.last_update = None  # wall-clock time, for display
+        self._last_update_monotonic = None  # for scheduling
         self.latest_data = None
         logger.info(f"Initialized perception source: {self.name}")
     
@@ -66,11 +82,23 @@ class PerceptionSource:
         if not self.enabled:
             return False
             
-        if self.last_update is None:
+        if self._last_update_monotonic is None:
             return True
             
-        elapsed_minutes = (datetime.utcnow() - self.last_update).total_seconds() / 60
-        return elapsed_minutes >= self.frequency_minutes
+        return time.monotonic() - self._last_update_monotonic >= self.frequency_minutes * 60
+    
+    def seconds_until_update(self) -> float:
+        """
+        Get the number of seconds until the source is next due for an update.
+        
+        Returns:
+            Seconds until the next update, or 0 if it is already due
+        """
+        if self._last_update_monotonic is None:
+            return 0.0
+        
+        elapsed_seconds = time.monotonic() - self._last_update_monotonic
+        return max(0.0, self.frequency_minutes * 60 - elapsed_seconds)
     
     def update(self) -> Dict[str, Any]:
         """
@@ -86,6 +114,7 @@ class PerceptionSource:
             
             self.latest_data = processed_data
             self.last_update = datetime.utcnow()
+            self._last_update_monotonic = time.monotonic()
             
             logger.info(f"Successfully updated perception source: {self.name}")
             return processed_data
@@ -128,8 +157,11 @@ class PerceptionManager:
     def __init__(self):
         """Initialize the perception manager."""
         self.sources = {}  # name -> source
+        self._sources_tuple = ()  # immutable snapshot of sources, rebuilt on change
+        self._sources_lock = threading.Lock()
         self.background_thread = None
         self.running = False
+        self._stop = threading.Event()
         self.perception_data = {}  # name -> latest data
         logger.info("Initialized perception manager")
     
@@ -140,7 +172,9 @@ class PerceptionManager:
         Args:
             source: The perception source to register
         """
-        self.sources[source.name] = source
+        with self._sources_lock:
+            self.sources[source.name] = source
+            self._sources_tuple = tuple(self.sources.values())
         logger.info(f"Registered perception source: {source.name}")
     
     def unregister_source(self, name: str) -> None:
@@ -150,9 +184,12 @@ class PerceptionManager:
         Args:
             name: Name of the source to unregister
         """
-        if name in self.sources:
+        with self._sources_lock:
+            if name not in self.sources:
+                return
             del self.sources[name]
-            logger.info(f"Unregistered perception source: {name}")
+            self._sources_tuple = tuple(self.sources.values())
+        logger.info(f"Unregistered perception source: {name}")
     
     def get_source(self, name: str) -> Optional[PerceptionSource]:
         """
@@ -173,7 +210,7 @@ class PerceptionManager:
         Returns:
             List of all perception sources
         """
-        return list(self.sources.values())
+        return list(self._sources_tuple)
     
     def update_source(self, name: str, force: bool = False) -> Dict[str, Any]:
         """
@@ -208,11 +245,19 @@ class PerceptionManager:
             Dict mapping source names to their perception data
         """
         results = {}
-        for name, source in self.sources.items():
-            if force or source.should_update():
-                data = source.update()
-                self.perception_data[name] = data
-                results[name] = data
+        # Iterate a snapshot so concurrent registration can't disturb the loop,
+        # and update due sources in parallel since perception is I/O-bound
+        pool = _get_update_pool()
+        futures = {
+            pool.submit(source.update): source.name
+            for source in self._sources_tuple
+            if force or source.should_update()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            data = future.result()
+            self.perception_data[name] = data
+            results[name] = data
         
         return results
     
@@ -235,23 +280,58 @@ class PerceptionManager:
         """
         Start a background thread to update perception sources.
         
+        Each source is woken only when it is next due. Newly registered or
+        re-enabled sources are picked up within one interval.
+        
         Args:
-            interval_seconds: How often to check for updates (in seconds)
+            interval_seconds: Longest time to wait between checks (in seconds)
         """
         if self.running:
             logger.warning("Background updates already running")
             return
         
         self.running = True
+        self._stop.clear()
         
         def update_loop():
-            while self.running:
+            heap = []  # (next_due_monotonic, source name)
+            scheduled = set()
+            
+            while not self._stop.is_set():
                 try:
-                    self.update_all_sources()
+                    now = time.monotonic()
+                    
+                    # Schedule any sources registered since the last pass
+                    for source in self._sources_tuple:
+                        if source.name not in scheduled:
+                            heapq.heappush(heap, (now + source.seconds_until_update(), source.name))
+                            scheduled.add(source.name)
+                    
+                    # Update every source that is due
+                    while heap and heap[0][0] <= now and not self._stop.is_set():
+                        _, name = heapq.heappop(heap)
+                        source = self.get_source(name)
+                        if source is None:
+                            scheduled.discard(name)
+                            continue
+                        
+                        if source.should_update():
+                            self.update_source(name)
+                        
+                        # A source still due after updating failed (or is disabled),
+                        # so it is retried on the next tick rather than a full period later
+                        delay = source.seconds_until_update() if source.enabled else 0.0
+                        if delay <= 0:
+                            delay = interval_seconds
+                        heapq.heappush(heap, (time.monotonic() + delay, name))
                 except Exception as e:
                     logger.error(f"Error in background update loop: {str(e)}")
                 
-                time.sleep(interval_seconds)
+                # Sleep until the next source is due, or until stopped
+                timeout = interval_seconds
+                if heap:
+                    timeout = min(timeout, max(0.0, heap[0][0] - time.monotonic()))
+                self._stop.wait(timeout=timeout)
         
         self.background_thread = threading.Thread(target=update_loop, daemon=True)
         self.background_thread.start()
@@ -260,6 +340,7 @@ class PerceptionManager:
     def stop_background_updates(self) -> None:
         """Stop the background update thread."""
         self.running = False
+        self._stop.set()
         if self.background_thread:
             self.background_thread.join(timeout=1.0)
             self.background_thread = None
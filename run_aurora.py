@@ -6,11 +6,8 @@ This script runs Aurora continuously in a 24/7 mode, automatically
 switching between day and night phases based on the time.
 """
 
-import os
-import sys
 import time
 import logging
-import subprocess
 import datetime
 from typing import Optional
 
@@ -25,37 +22,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger("agent_garden.aurora_runner")
 
+# Imported after logging is configured so garden's own basicConfig is a no-op
+from garden import main as garden_main
+
+# Day phase: 8 AM to 8 PM
+DAY_PHASE_START_HOUR = 8
+NIGHT_PHASE_START_HOUR = 20
+
 def determine_phase() -> str:
     """Determine the current phase based on the time of day."""
     current_hour = datetime.datetime.now().hour
     
-    # Day phase: 8 AM to 8 PM
-    if 8 <= current_hour < 20:
+    if DAY_PHASE_START_HOUR <= current_hour < NIGHT_PHASE_START_HOUR:
         return "day"
     else:
         return "night"
 
+def seconds_until_next_phase_change(now: Optional[datetime.datetime] = None) -> float:
+    """
+    Compute how long until the next day/night phase boundary.
+    
+    Args:
+        now: Reference local time (defaults to the current time)
+        
+    Returns:
+        Seconds until the next phase boundary
+    """
+    now = now or datetime.datetime.now()
+    
+    boundaries = []
+    for hour in (DAY_PHASE_START_HOUR, NIGHT_PHASE_START_HOUR):
+        boundary = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if boundary <= now:
+            boundary += datetime.timedelta(days=1)
+        boundaries.append(boundary)
+    
+    return (min(boundaries) - now).total_seconds()
+
 def run_phase(phase: str) -> dict:
     """Run a single phase using the garden.py main function directly."""
     try:
         logger.info(f"Starting {phase} phase")
         start_time = time.time()
         
-        # Import here to avoid circular imports
-        from garden import main
-        
-        # Set up command line arguments for garden.py
-        # Save original argv
-        original_argv = sys.argv.copy()
-        
-        # Set new argv for garden.py
-        sys.argv = ['garden.py', '--phase', phase]
-        
-        # Run the main function
-        main()
-        
-        # Restore original argv
-        sys.argv = original_argv
+        # Run the phase directly; passing the phase skips garden's CLI parsing
+        garden_main(phase)
         
         duration = time.time() - start_time
         logger.info(f"{phase.capitalize()} phase completed in {duration:.2f} seconds")
@@ -65,14 +76,18 @@ def run_phase(phase: str) -> dict:
         logger.error(f"Error in {phase} phase: {str(e)}", exc_info=True)
         return {"error": str(e)}
 
-def run_continuously(check_interval_minutes: int = 15):
+def run_continuously(check_interval_minutes: Optional[int] = None):
     """
-    Run Aurora continuously, checking the current phase every interval.
+    Run Aurora continuously, sleeping until each phase change.
     
     Args:
-        check_interval_minutes: How often to check if the phase should change (in minutes)
+        check_interval_minutes: Optional cap on how long to sleep between
+            phase checks (in minutes)
     """
-    logger.info(f"Starting Aurora in 24/7 mode (checking phase every {check_interval_minutes} minutes)")
+    if check_interval_minutes:
+        logger.info(f"Starting Aurora in 24/7 mode (checking phase at least every {check_interval_minutes} minutes)")
+    else:
+        logger.info("Starting Aurora in 24/7 mode (checking phase at each phase change)")
     
     last_phase = None
     
@@ -87,17 +102,20 @@ def run_continuously(check_interval_minutes: int = 15):
         else:
             logger.info(f"Staying in {current_phase} phase")
         
-        # Wait for the next check
-        logger.info(f"Sleeping for {check_interval_minutes} minutes")
-        time.sleep(check_interval_minutes * 60)
+        # Sleep until just after the next phase boundary
+        sleep_seconds = seconds_until_next_phase_change() + 1
+        if check_interval_minutes:
+            sleep_seconds = min(sleep_seconds, check_interval_minutes * 60)
+        logger.info(f"Sleeping for {sleep_seconds / 60:.1f} minutes")
+        time.sleep(sleep_seconds)
 
 def main():
     """Main entry point for the Aurora runner."""
     import argparse
     
     parser = argparse.ArgumentParser(description="Run Aurora in 24/7 mode")
-    parser.add_argument("--interval", type=int, default=15, 
-                        help="Interval in minutes to check for phase changes")
+    parser.add_argument("--interval", type=int, default=None, 
+                        help="Maximum minutes to sleep between phase checks (default: until the next phase change)")
     parser.add_argument("--single-run", action="store_true", 
                         help="Run once and exit (for testing)")
     parser.add_argument("--force-phase", choices=["day", "night"], 
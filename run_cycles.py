@@ -11,85 +11,168 @@ import time
 import argparse
 import logging
 import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout, redirect_stderr
+from io import StringIO
 from datetime import datetime, timedelta
+from helpers.logging_helper import start_buffered_logging, start_worker_logging, forward_worker_logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("cycle_runner.log"),
-        logging.StreamHandler()
-    ]
-)
+# Set up logging; file writes are batched on a background thread
+start_buffered_logging("cycle_runner.log")
 logger = logging.getLogger("agent_garden.cycle_runner")
 
-def run_cycle(cycle_number, phase=None):
+# Imported after logging is configured so garden's own basicConfig is a no-op
+from garden import pulse
+
+def _run_garden_in_process(phase=None):
+    """Run a garden pulse in this interpreter, capturing its console output."""
+    buf_out, buf_err = StringIO(), StringIO()
+    with redirect_stdout(buf_out), redirect_stderr(buf_err):
+        results = pulse(force_phase=phase)
+    return results, buf_out.getvalue(), buf_err.getvalue()
+
+def _run_garden_subprocess(phase=None):
+    """Run garden.py in a separate interpreter for full isolation."""
+    # Build the command to run garden.py with the appropriate phase
+    cmd = [sys.executable, 'garden.py']
+    if phase:
+        cmd.extend(['--phase', phase])
+    
+    # Run the command as a subprocess
+    logger.info("Running command: %s", " ".join(cmd))
+    process = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return None, process.stdout, process.stderr
+
+def run_cycle(cycle_number, phase=None, use_subprocess=False):
     """Run a single cycle with the specified phase."""
     try:
-        logger.info(f"Starting cycle {cycle_number}{f' in {phase} phase' if phase else ''}")
-        start_time = time.time()
-        
-        # Build the command to run garden.py with the appropriate phase
-        cmd = [sys.executable, 'garden.py']
-        if phase:
-            cmd.extend(['--phase', phase])
+        logger.info("Starting cycle %d%s", cycle_number, f" in {phase} phase" if phase else "")
+        start_ns = time.perf_counter_ns()
         
-        # Run the command as a subprocess
-        logger.info(f"Running command: {' '.join(cmd)}")
-        process = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        if use_subprocess:
+            results, stdout, stderr = _run_garden_subprocess(phase)
+        else:
+            results, stdout, stderr = _run_garden_in_process(phase)
         
         # Log the output
-        if process.stdout:
-            logger.info(f"Output:\n{process.stdout}")
-        if process.stderr:
-            logger.warning(f"Errors:\n{process.stderr}")
+        if stdout:
+            logger.info("Output:\n%s", stdout)
+        if stderr:
+            logger.warning("Errors:\n%s", stderr)
         
-        duration = time.time() - start_time
-        logger.info(f"Cycle {cycle_number} completed in {duration:.2f} seconds")
+        duration_ns = time.perf_counter_ns() - start_ns
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Cycle %d completed in %.2f seconds", cycle_number, duration_ns / 1e9)
         
-        return {"success": True, "stdout": process.stdout, "stderr": process.stderr}
+        return {"success": True, "results": results, "stdout": stdout, "stderr": stderr}
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error in cycle {cycle_number}: {str(e)}\nOutput: {e.stdout}\nError: {e.stderr}")
+        logger.error("Error in cycle %d: %s\nOutput: %s\nError: %s", cycle_number, e, e.stdout, e.stderr)
         return {"error": str(e), "stdout": e.stdout, "stderr": e.stderr}
     except Exception as e:
-        logger.error(f"Error in cycle {cycle_number}: {str(e)}", exc_info=True)
+        logger.error("Error in cycle %d: %s", cycle_number, e, exc_info=True)
         return {"error": str(e)}
 
-def run_multiple_cycles(num_cycles, delay_minutes=0):
+# Longest single sleep while waiting between phases
+WAIT_TICK_SECONDS = 5
+
+def wait_until(deadline, on_tick=None):
+    """
+    Sleep until a time.monotonic() deadline in short ticks.
+    
+    Args:
+        deadline: Monotonic time to wait until
+        on_tick: Optional callable run on every tick (e.g. schedule.run_pending)
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if on_tick:
+            on_tick()
+        time.sleep(min(remaining, WAIT_TICK_SECONDS))
+
+def run_multiple_cycles(num_cycles, delay_minutes=0, use_subprocess=False, on_tick=None):
     """Run multiple day/night cycles with a delay between them."""
-    for i in range(num_cycles):
-        cycle_number = i + 1
-        
-        # Run day phase
-        logger.info(f"=== Cycle {cycle_number} Day Phase ===")
-        day_results = run_cycle(cycle_number, phase="day")
-        
-        # Wait between phases if specified
-        if delay_minutes > 0:
-            logger.info(f"Waiting {delay_minutes} minutes before night phase...")
-            time.sleep(delay_minutes * 60)
+    delay_seconds = delay_minutes * 60
+    
+    # Each phase is followed by one delay before the next phase (day -> night -> next day)
+    phases = [(i + 1, phase) for i in range(num_cycles) for phase in ("day", "night")]
+    for index, (cycle_number, phase) in enumerate(phases):
+        if index > 0 and delay_seconds > 0:
+            logger.info("Waiting %d minutes before %s...", delay_minutes,
+                        "night phase" if phase == "night" else "next cycle")
+            wait_until(next_deadline, on_tick)
         
-        # Run night phase
-        logger.info(f"=== Cycle {cycle_number} Night Phase ===")
-        night_results = run_cycle(cycle_number, phase="night")
+        logger.info("=== Cycle %d %s Phase ===", cycle_number, phase.title())
+        run_cycle(cycle_number, phase=phase, use_subprocess=use_subprocess)
+        next_deadline = time.monotonic() + delay_seconds
         
-        # Wait between cycles if specified
-        if i < num_cycles - 1 and delay_minutes > 0:
-            logger.info(f"Waiting {delay_minutes} minutes before next cycle...")
-            time.sleep(delay_minutes * 60)
+        if phase == "night":
+            logger.info("Completed full cycle %d", cycle_number)
+
+def run_cycles_parallel(num_cycles, use_subprocess=False):
+    """
+    Run cycles concurrently in a process pool.
+    
+    All day phases run first, then all night phases, so each cycle's night
+    phase still follows its day phase.
+    
+    Args:
+        num_cycles: Number of cycles to run
+        use_subprocess: Run each phase in its own garden.py process
         
-        logger.info(f"Completed full cycle {cycle_number}")
+    Returns:
+        Dict mapping (cycle_number, phase) to that phase's results
+    """
+    # With forkserver, the garden is imported once in the server and every worker
+    # is forked from it, so re-running this script's imports in a worker is cheap
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+    max_workers = max(1, min(num_cycles, os.cpu_count() or 1))
+    
+    mp_context = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        mp_context.set_forkserver_preload(["garden"])
+    
+    # Workers log through a queue to this process, so their records reach cycle_runner.log
+    log_queue = mp_context.Queue()
+    log_listener = forward_worker_logging(log_queue)
+    
+    results = {}
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                 initializer=start_worker_logging, initargs=(log_queue,)) as executor:
+            for phase in ("day", "night"):
+                logger.info("=== Cycles 1-%d %s Phase (parallel) ===", num_cycles, phase.title())
+                futures = {
+                    executor.submit(run_cycle, cycle_number, phase, use_subprocess): cycle_number
+                    for cycle_number in range(1, num_cycles + 1)
+                }
+                for future in as_completed(futures):
+                    cycle_number = futures[future]
+                    results[(cycle_number, phase)] = future.result()
+                    logger.info("Completed cycle %d %s phase", cycle_number, phase)
+    finally:
+        log_listener.stop()
+    
+    return results
 
 def main():
     """Main entry point for the cycle runner."""
     parser = argparse.ArgumentParser(description="Run multiple Agent Garden cycles")
     parser.add_argument("--cycles", type=int, default=3, help="Number of cycles to run")
     parser.add_argument("--delay", type=int, default=0, help="Delay between phases in minutes")
+    parser.add_argument("--subprocess", action="store_true", help="Run each phase in a separate Python process")
+    parser.add_argument("--parallel", action="store_true", help="Run cycles concurrently in a process pool (ignores --delay)")
     args = parser.parse_args()
     
-    logger.info(f"Starting Agent Garden Cycle Runner with {args.cycles} cycles")
-    run_multiple_cycles(args.cycles, args.delay)
+    logger.info("Starting Agent Garden Cycle Runner with %d cycles", args.cycles)
+    if args.parallel:
+        if args.delay > 0:
+            logger.warning("--delay is ignored when running cycles in parallel")
+        run_cycles_parallel(args.cycles, args.subprocess)
+    else:
+        run_multiple_cycles(args.cycles, args.delay, args.subprocess)
     logger.info("All cycles completed")
 
 if __name__ == "__main__":
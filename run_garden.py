@@ -8,29 +8,42 @@ It can be used with cron or as a long-running process.
 
 import os
 import time
+import signal
+import threading
 import schedule
 import argparse
 import logging
 from datetime import datetime
-from garden import pulse, load_agent_config
+from helpers.logging_helper import start_buffered_logging, stop_buffered_logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("garden_scheduler.log"),
-        logging.StreamHandler()
-    ]
-)
+# Set up logging; file writes are batched on a background thread
+start_buffered_logging("garden_scheduler.log")
 logger = logging.getLogger("agent_garden")
 
+# Imported after logging is configured so garden's own basicConfig is a no-op
+from garden import pulse, load_agent_config
+
+# Longest single sleep, so wall-clock jumps are noticed within a few minutes
+MAX_IDLE_SECONDS = 300
+
+# Set by the SIGTERM handler to end the scheduler loop
+_stop = threading.Event()
+
+def _handle_sigterm(signum, frame):
+    """Stop the scheduler loop at its next wakeup."""
+    logger.info("Received SIGTERM, stopping scheduler")
+    _stop.set()
+
 def run_pulse(phase=None):
     """Run a pulse cycle with logging."""
     try:
         logger.info(f"Starting pulse cycle{f' in {phase} phase' if phase else ''}")
         results = pulse(force_phase=phase)
-        logger.info(f"Pulse cycle completed successfully: {results}")
+        # Log a summary; the full results (which may hold generated content) only at DEBUG
+        logger.info("Pulse cycle completed successfully: keys=%s, completed_tasks=%d, failed_tasks=%d",
+                    list(results), len(results.get("completed_tasks", [])),
+                    len(results.get("failed_tasks", [])))
+        logger.debug("Full pulse results: %s", results)
         return results
     except Exception as e:
         logger.error(f"Error in pulse cycle: {str(e)}", exc_info=True)
@@ -77,12 +90,19 @@ def main():
             # Run pending jobs immediately
             schedule.run_pending()
             
-            # Keep running
+            # Sleep until the next scheduled job instead of polling every minute
+            signal.signal(signal.SIGTERM, _handle_sigterm)
             while True:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    idle_seconds = MAX_IDLE_SECONDS
+                if _stop.wait(max(1, min(idle_seconds, MAX_IDLE_SECONDS))):
+                    break
+            stop_buffered_logging()
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user")
+            stop_buffered_logging()
         except Exception as e:
             logger.error(f"Scheduler error: {str(e)}", exc_info=True)
 
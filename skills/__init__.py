@@ -10,20 +10,13 @@ from .research_skill import ResearchSkill
 from .content_creation_skill import ContentCreationSkill
 from .monitoring_skill import MonitoringSkill
 
-# Initialize default skills
-registry.register_skill(ResearchSkill)
-registry.register_skill(ContentCreationSkill)
-registry.register_skill(MonitoringSkill)
-
-# Instantiate default skills
-research_skill = ResearchSkill()
-registry.skills["research"] = research_skill
-
-content_creation_skill = ContentCreationSkill()
-registry.skills["content_creation"] = content_creation_skill
-
-monitoring_skill = MonitoringSkill()
-registry.skills["monitoring"] = monitoring_skill
+# Instantiate default skills. They are loaded eagerly because the instance
+# names below shadow the submodules of the same name, which only holds if
+# every submodule is imported before the instances are bound. Other skills
+# can still be loaded on first use through registry.register_lazy().
+research_skill = registry.register_instance(ResearchSkill())
+content_creation_skill = registry.register_instance(ContentCreationSkill())
+monitoring_skill = registry.register_instance(MonitoringSkill())
 
 __all__ = [
     'BaseSkill',
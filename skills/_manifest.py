@@ -0,0 +1,12 @@
+"""
+Skill Manifest for Agent Garden
+------------------------------
+Generated by build_skill_manifest.py; do not edit by hand.
+"""
+
+# (module path, class name) of every skill class
+SKILL_MANIFEST = (
+    ('skills.content_creation_skill', 'ContentCreationSkill'),
+    ('skills.monitoring_skill', 'MonitoringSkill'),
+    ('skills.research_skill', 'ResearchSkill'),
+)
@@ -4,17 +4,33 @@ Base Skill Module for Agent Garden
 This module defines the base class for all skill modules.
 """
 
+import os
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Iterable, ClassVar
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers are configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Skills add an artificial delay to each task when either variable is set
+SIMULATE_LATENCY_ENV_VARS = ("AGENT_GARDEN_SIMULATE", "AGENT_SIMULATE_LATENCY")
+SIMULATED_DELAY_SECONDS = 1
+
+def simulate_latency() -> bool:
+    """Return True if skills should simulate work with an artificial delay."""
+    return any(os.environ.get(name) for name in SIMULATE_LATENCY_ENV_VARS)
+
 class BaseSkill(ABC):
     """Base class for all skill modules."""
     
+    # Registry name of the skill; subclasses set this to their default name
+    NAME: ClassVar[str] = ""
+    
+    # Maximum number of tasks run concurrently by execute_batch
+    max_batch_workers = 8
+    
     def __init__(self, name: str, description: str, version: str = "0.1.0"):
         """
         Initialize the skill.
@@ -28,7 +44,8 @@ class BaseSkill(ABC):
         self.description = description
         self.version = version
         self.enabled = True
-        logger.info(f"Initialized skill: {self.name} v{self.version}")
+        self._refresh_aliases()
+        logger.info("Initialized skill: %s v%s", self.name, self.version)
     
     @abstractmethod
     def execute(self, task: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -44,6 +61,45 @@ class BaseSkill(ABC):
         """
         pass
     
+    async def execute_async(self, task: Dict[str, Any], 
+                            context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute the skill without blocking the event loop.
+        
+        The default implementation runs execute() in a worker thread, so
+        concurrent tasks overlap their waits.
+        
+        Args:
+            task: The task to execute
+            context: Additional context for the execution
+            
+        Returns:
+            Dict containing the results of the execution
+        """
+        return await asyncio.to_thread(self.execute, task, context)
+    
+    def execute_batch(self, tasks: List[Dict[str, Any]], 
+                      context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute several tasks concurrently on a thread pool.
+        
+        Tasks overlap while they wait on I/O (e.g. LLM or API calls). Subclasses
+        whose execute() mutates shared instance state must make it thread-safe
+        or override this method.
+        
+        Args:
+            tasks: The tasks to execute
+            context: Additional context shared by all executions
+            
+        Returns:
+            List of execution results, in the same order as tasks
+        """
+        if len(tasks) <= 1:
+            return [self.execute(task, context) for task in tasks]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_batch_workers, len(tasks))) as executor:
+            return list(executor.map(lambda task: self.execute(task, context), tasks))
+    
     def validate_task(self, task: Dict[str, Any]) -> bool:
         """
         Validate that the task can be executed by this skill.
@@ -55,10 +111,8 @@ class BaseSkill(ABC):
             True if the task can be executed, False otherwise
         """
         # Default implementation checks if the skill name is in the task's skill_required field
-        return (
-            "skill_required" in task and 
-            (task["skill_required"] == self.name or task["skill_required"] in self.get_aliases())
-        )
+        required = task.get("skill_required")
+        return required is not None and required in self._alias_set
     
     def get_aliases(self) -> List[str]:
         """
@@ -69,6 +123,36 @@ class BaseSkill(ABC):
         """
         return []
     
+    def _refresh_aliases(self) -> None:
+        """
+        Rebuild the cached set of names this skill answers to.
+        
+        Subclasses whose name or aliases change after initialization must call this.
+        """
+        self._alias_set = frozenset([self.name, *self.get_aliases()])
+    
+    def get_keyword_triggers(self) -> Optional[Iterable[str]]:
+        """
+        Get the lowercase description substrings that can make validate_task accept a task.
+        
+        The registry indexes these to narrow down which skills to validate. Return
+        None (the default) if validate_task matches on anything else, so the skill
+        is always checked.
+        
+        Returns:
+            Keyword triggers, or None if they cannot be listed
+        """
+        return None
+    
+    def get_tag_triggers(self) -> Optional[Iterable[str]]:
+        """
+        Get the task tags that can make validate_task accept a task.
+        
+        Returns:
+            Tag triggers, or None if they cannot be listed
+        """
+        return None
+    
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get metadata about the skill.
@@ -87,12 +171,12 @@ class BaseSkill(ABC):
     def enable(self) -> None:
         """Enable the skill."""
         self.enabled = True
-        logger.info(f"Enabled skill: {self.name}")
+        logger.info("Enabled skill: %s", self.name)
     
     def disable(self) -> None:
         """Disable the skill."""
         self.enabled = False
-        logger.info(f"Disabled skill: {self.name}")
+        logger.info("Disabled skill: %s", self.name)
     
     def __str__(self) -> str:
         return f"{self.name} v{self.version} - {self.description}"
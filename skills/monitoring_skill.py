@@ -4,21 +4,198 @@ Monitoring Skill Module for Agent Garden
 This module provides monitoring capabilities to agents.
 """
 
+import re
 import logging
 import random
 import time
 import json
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from .base_skill import BaseSkill
+import functools
+import itertools
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from .base_skill import BaseSkill, simulate_latency, SIMULATED_DELAY_SECONDS
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers are configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Private generator for simulated readings, so draws skip the shared module-level state
+_RNG = random.Random()
+
+# Description keywords that mark a task as monitoring
+_MONITORING_KEYWORDS = frozenset(["monitor", "track", "measure", "observe", "analyze", "metrics", "kpi"])
+
+# Matches any monitoring keyword, stopping at the first hit
+_MONITORING_KEYWORD_RE = re.compile("|".join(sorted(_MONITORING_KEYWORDS)))
+
+# Tags that mark a task as monitoring
+_MONITORING_TAGS = frozenset(["monitoring", "metrics", "tracking", "analytics"])
+
+# Financial inclusion metrics
+_FINANCIAL_METRICS = (
+    "account_access",
+    "transaction_volume",
+    "loan_approval_rates",
+    "financial_literacy",
+    "banking_penetration"
+)
+
+# System performance metrics
+_PERFORMANCE_METRICS = (
+    "response_time",
+    "error_rate",
+    "uptime",
+    "resource_utilization",
+    "throughput"
+)
+
+# User engagement metrics
+_ENGAGEMENT_METRICS = (
+    "active_users",
+    "session_duration",
+    "conversion_rate",
+    "retention_rate",
+    "feature_usage"
+)
+
+# Market trends metrics
+_MARKET_METRICS = (
+    "competitor_activity",
+    "industry_growth",
+    "pricing_trends",
+    "innovation_rate",
+    "market_share"
+)
+
+# Regulatory compliance metrics
+_COMPLIANCE_METRICS = (
+    "policy_adherence",
+    "audit_results",
+    "incident_reports",
+    "compliance_training",
+    "regulatory_changes"
+)
+
+_ALL_METRICS = _FINANCIAL_METRICS + _PERFORMANCE_METRICS + _ENGAGEMENT_METRICS + _MARKET_METRICS + _COMPLIANCE_METRICS
+
+# Mixed metrics used when no category is identified: the lead metric of each category
+_MIXED_METRICS = (
+    _FINANCIAL_METRICS[0],
+    _PERFORMANCE_METRICS[0],
+    _ENGAGEMENT_METRICS[0],
+    _MARKET_METRICS[0],
+    _COMPLIANCE_METRICS[0]
+)
+
+# Display names for metrics, e.g. "error_rate" -> "Error Rate"
+_METRIC_PRETTY = {metric: metric.replace('_', ' ').title() for metric in _ALL_METRICS}
+
+# Metric insight templates, filled with the display name and the change
+_INCREASE_INSIGHT = "{} has increased significantly by {}%"
+_DECREASE_INSIGHT = "{} has decreased significantly by {}%"
+_POSITIVE_TREND_INSIGHT = "{} shows strong positive trend over the past week (+{}%)"
+_NEGATIVE_TREND_INSIGHT = "{} shows concerning negative trend over the past week ({}%)"
+
+# Map of keywords to monitoring categories, in priority order
+_CATEGORY_KEYWORDS = {
+    "financial": "financial_inclusion",
+    "inclusion": "financial_inclusion",
+    "equity": "financial_inclusion",
+    "performance": "system_performance",
+    "system": "system_performance",
+    "uptime": "system_performance",
+    "user": "user_engagement",
+    "engagement": "user_engagement",
+    "market": "market_trends",
+    "trend": "market_trends",
+    "regulatory": "regulatory_compliance",
+    "compliance": "regulatory_compliance",
+    "regulation": "regulatory_compliance"
+}
+
+# One pattern over every keyword; the lookahead reports the longest keyword
+# starting at each position, so a single scan finds overlapping matches too
+_ALL_KEYWORDS = sorted(_MONITORING_KEYWORDS | set(_CATEGORY_KEYWORDS), key=len, reverse=True)
+_KEYWORD_RE = re.compile("(?=(" + "|".join(_ALL_KEYWORDS) + "))")
+
+# Keywords implied by each match (itself plus any keywords it contains)
+_IMPLIED_KEYWORDS = {
+    keyword: frozenset(other for other in _ALL_KEYWORDS if other in keyword)
+    for keyword in _ALL_KEYWORDS
+}
+
+def _scan_keywords(text: str) -> frozenset:
+    """
+    Find every monitoring keyword that occurs in text, in one regex pass.
+    
+    Args:
+        text: Lowercase text to scan
+        
+    Returns:
+        Set of keywords that occur as substrings of text
+    """
+    return frozenset().union(*[_IMPLIED_KEYWORDS[match] for match in set(_KEYWORD_RE.findall(text))])
+
+def _first_category(hits: frozenset) -> Optional[str]:
+    """Return the category of the highest-priority keyword in hits, if any."""
+    if hits:
+        for keyword, category in _CATEGORY_KEYWORDS.items():
+            if keyword in hits:
+                return category
+    return None
+
+# Number of daily points in each generated time series
+_SERIES_DAYS = 30
+
+@functools.lru_cache(maxsize=4)
+def _series_dates(end_date: date) -> Tuple[str, ...]:
+    """
+    ISO date strings for the daily series ending on end_date, cached per day.
+    
+    Args:
+        end_date: Date of the last point in the series
+        
+    Returns:
+        Tuple of "YYYY-MM-DD" strings, oldest first
+    """
+    return tuple((end_date - timedelta(days=_SERIES_DAYS-1-i)).isoformat() for i in range(_SERIES_DAYS))
+
+def _series_values(base_value: float, trend: float, noise: List[float]) -> List[float]:
+    """
+    Compute a trending daily series from pre-drawn noise.
+    
+    Args:
+        base_value: Value on the first day
+        trend: Fractional change per day
+        noise: One random offset per day
+        
+    Returns:
+        Daily values rounded to 2 decimals
+    """
+    return [round(base_value * (1 + trend * i) + offset, 2) for i, offset in enumerate(noise)]
+
+def _week_change(values: List[float]) -> float:
+    """
+    Percentage change between the average of the last 7 values and the values before them.
+    
+    Args:
+        values: Up to the last 14 daily values, oldest first
+        
+    Returns:
+        Week-over-week change in percent
+    """
+    recent_week = values[-7:]
+    previous_week = values[:-7]
+    
+    recent_avg = sum(recent_week) / len(recent_week)
+    previous_avg = sum(previous_week) / len(previous_week)
+    
+    return (recent_avg - previous_avg) / previous_avg * 100
+
 class MonitoringSkill(BaseSkill):
     """Skill for monitoring metrics and systems."""
     
+    NAME = "monitoring"
+    
     def __init__(self, name: str = "monitoring", description: str = "Monitors metrics and systems"):
         """Initialize the monitoring skill."""
         super().__init__(name, description)
@@ -41,31 +218,33 @@ class MonitoringSkill(BaseSkill):
         Returns:
             Dict containing the monitoring results
         """
-        if not self.validate_task(task):
+        # Lowercase the description once for validation and all keyword matching
+        desc_lower = task.get("description", "").lower()
+        
+        if not self.validate_task(task, desc_lower):
             return {
                 "success": False,
                 "error": "Task is not a valid monitoring task"
             }
         
-        description = task.get("description", "")
+        # Take the time once; all timestamps in the result derive from it
+        now = datetime.utcnow()
         
         # Determine what to monitor from the task
-        monitoring_category = self._determine_monitoring_category(task)
+        monitoring_category = self._determine_monitoring_category(task, desc_lower)
         
         # Extract specific metrics or systems to monitor
-        metrics = self._extract_metrics_from_task(task)
+        metrics = self._extract_metrics_from_task(task, desc_lower)
         
-        logger.info(f"Monitoring {monitoring_category}: {metrics}")
+        logger.info("Monitoring %s: %s", monitoring_category, metrics)
         
         # In a real implementation, this would connect to APIs, databases, etc.
-        # For now, we'll simulate monitoring with a delay and random data
-        time.sleep(1)  # Simulate monitoring time
+        # For now, we'll simulate monitoring with random data
+        if simulate_latency():
+            time.sleep(SIMULATED_DELAY_SECONDS)  # Simulate monitoring time
         
-        # Generate monitoring data based on category and metrics
-        monitoring_data = self._generate_monitoring_data(monitoring_category, metrics)
-        
-        # Generate insights from the data
-        insights = self._generate_insights(monitoring_category, monitoring_data)
+        # Generate monitoring data and the insights drawn from it in one pass
+        monitoring_data, insights = self._build_monitoring_result(monitoring_category, metrics, now)
         
         return {
             "success": True,
@@ -73,16 +252,17 @@ class MonitoringSkill(BaseSkill):
             "metrics": metrics,
             "data": monitoring_data,
             "insights": insights,
-            "timestamp": datetime.utcnow().isoformat(),
-            "next_scheduled_check": (datetime.utcnow() + timedelta(days=1)).isoformat()
+            "timestamp": now.isoformat(),
+            "next_scheduled_check": (now + timedelta(days=1)).isoformat()
         }
     
-    def validate_task(self, task: Dict[str, Any]) -> bool:
+    def validate_task(self, task: Dict[str, Any], desc_lower: Optional[str] = None) -> bool:
         """
         Validate that the task is a monitoring task.
         
         Args:
             task: The task to validate
+            desc_lower: The task description already lowercased, if available
             
         Returns:
             True if the task is a valid monitoring task, False otherwise
@@ -92,175 +272,138 @@ class MonitoringSkill(BaseSkill):
             return True
         
         # Check if the task description indicates monitoring
-        description = task.get("description", "").lower()
-        monitoring_keywords = ["monitor", "track", "measure", "observe", "analyze", "metrics", "kpi"]
+        description = desc_lower if desc_lower is not None else task.get("description", "").lower()
         
         # Check if any tags indicate monitoring
         tags = task.get("tags", [])
-        monitoring_tags = ["monitoring", "metrics", "tracking", "analytics"]
         
         return (
-            any(keyword in description for keyword in monitoring_keywords) or
-            any(tag in tags for tag in monitoring_tags)
+            _MONITORING_KEYWORD_RE.search(description) is not None or
+            not _MONITORING_TAGS.isdisjoint(tags)
         )
     
     def get_aliases(self) -> List[str]:
         """Get aliases for the monitoring skill."""
         return ["tracking", "metrics", "analytics", "measurement"]
     
-    def _determine_monitoring_category(self, task: Dict[str, Any]) -> str:
+    def get_keyword_triggers(self) -> List[str]:
+        """Get the description keywords that indicate monitoring."""
+        return list(_MONITORING_KEYWORDS)
+    
+    def get_tag_triggers(self) -> List[str]:
+        """Get the tags that indicate monitoring."""
+        return list(_MONITORING_TAGS)
+    
+    def _determine_monitoring_category(self, task: Dict[str, Any], desc_lower: Optional[str] = None) -> str:
         """
         Determine the category of monitoring based on the task.
         
         Args:
             task: The monitoring task
+            desc_lower: The task description already lowercased, if available
             
         Returns:
             The determined monitoring category
         """
-        description = task.get("description", "").lower()
+        description = desc_lower if desc_lower is not None else task.get("description", "").lower()
         tags = task.get("tags", [])
         
-        # Map of keywords to monitoring categories
-        category_keywords = {
-            "financial": "financial_inclusion",
-            "inclusion": "financial_inclusion",
-            "equity": "financial_inclusion",
-            "performance": "system_performance",
-            "system": "system_performance",
-            "uptime": "system_performance",
-            "user": "user_engagement",
-            "engagement": "user_engagement",
-            "market": "market_trends",
-            "trend": "market_trends",
-            "regulatory": "regulatory_compliance",
-            "compliance": "regulatory_compliance",
-            "regulation": "regulatory_compliance"
-        }
-        
         # Check description for category keywords
-        for keyword, category in category_keywords.items():
-            if keyword in description:
-                return category
+        category = _first_category(_scan_keywords(description))
+        if category:
+            return category
         
         # Check tags for category keywords
         for tag in tags:
-            for keyword, category in category_keywords.items():
-                if keyword in tag:
-                    return category
+            category = _first_category(_scan_keywords(tag))
+            if category:
+                return category
         
         # Default to system performance if no specific category is identified
         return "system_performance"
     
-    def _extract_metrics_from_task(self, task: Dict[str, Any]) -> List[str]:
+    def _extract_metrics_from_task(self, task: Dict[str, Any], desc_lower: Optional[str] = None) -> List[str]:
         """
         Extract specific metrics to monitor from the task.
         
         Args:
             task: The monitoring task
+            desc_lower: The task description already lowercased, if available
             
         Returns:
             List of metrics to monitor
         """
-        description = task.get("description", "").lower()
-        
-        # Financial inclusion metrics
-        financial_metrics = [
-            "account_access",
-            "transaction_volume",
-            "loan_approval_rates",
-            "financial_literacy",
-            "banking_penetration"
-        ]
-        
-        # System performance metrics
-        performance_metrics = [
-            "response_time",
-            "error_rate",
-            "uptime",
-            "resource_utilization",
-            "throughput"
-        ]
-        
-        # User engagement metrics
-        engagement_metrics = [
-            "active_users",
-            "session_duration",
-            "conversion_rate",
-            "retention_rate",
-            "feature_usage"
-        ]
-        
-        # Market trends metrics
-        market_metrics = [
-            "competitor_activity",
-            "industry_growth",
-            "pricing_trends",
-            "innovation_rate",
-            "market_share"
-        ]
-        
-        # Regulatory compliance metrics
-        compliance_metrics = [
-            "policy_adherence",
-            "audit_results",
-            "incident_reports",
-            "compliance_training",
-            "regulatory_changes"
-        ]
+        description = desc_lower if desc_lower is not None else task.get("description", "").lower()
+        hits = _scan_keywords(description)
         
         # Determine which set of metrics to use based on the description
-        if "financial" in description or "inclusion" in description:
-            return financial_metrics
-        elif "performance" in description or "system" in description:
-            return performance_metrics
-        elif "user" in description or "engagement" in description:
-            return engagement_metrics
-        elif "market" in description or "trend" in description:
-            return market_metrics
-        elif "regulatory" in description or "compliance" in description:
-            return compliance_metrics
+        if "financial" in hits or "inclusion" in hits:
+            return list(_FINANCIAL_METRICS)
+        elif "performance" in hits or "system" in hits:
+            return list(_PERFORMANCE_METRICS)
+        elif "user" in hits or "engagement" in hits:
+            return list(_ENGAGEMENT_METRICS)
+        elif "market" in hits or "trend" in hits:
+            return list(_MARKET_METRICS)
+        elif "regulatory" in hits or "compliance" in hits:
+            return list(_COMPLIANCE_METRICS)
         else:
             # Return a mix of metrics if no specific category is identified
-            all_metrics = financial_metrics + performance_metrics + engagement_metrics + market_metrics + compliance_metrics
-            return random.sample(all_metrics, min(5, len(all_metrics)))
+            return list(_MIXED_METRICS)
     
-    def _generate_monitoring_data(self, category: str, metrics: List[str]) -> Dict[str, Any]:
+    def _build_monitoring_result(self, category: str, metrics: List[str], 
+                                 now: Optional[datetime] = None) -> Tuple[Dict[str, Any], List[str]]:
         """
-        Generate monitoring data based on category and metrics.
+        Generate monitoring data based on category and metrics, and the insights from it.
+        
+        Per-metric trend statistics are computed from the generated values while
+        they are at hand, rather than re-read from the time series afterwards.
         
         Args:
             category: The monitoring category
             metrics: The metrics to monitor
+            now: Current UTC time, which the series ends on (defaults to now)
             
         Returns:
-            Dict containing the monitoring data
+            Tuple of the monitoring data dict and the list of insights
         """
         data = {}
+        stats = []
+        
+        # Daily dates for the last 30 days, shared by every metric and every call that day
+        dates = _series_dates((now or datetime.utcnow()).date())
+        uniform = _RNG.uniform
         
         # Generate time series data for each metric
         for metric in metrics:
-            # Generate daily data points for the last 30 days
-            time_series = []
-            base_value = random.uniform(50, 100)
-            trend = random.uniform(-0.1, 0.1)  # Slight trend up or down
-            
-            for i in range(30):
-                date = (datetime.utcnow() - timedelta(days=29-i)).strftime("%Y-%m-%d")
-                value = base_value * (1 + trend * i) + random.uniform(-5, 5)
-                time_series.append({
-                    "date": date,
-                    "value": round(value, 2)
-                })
+            base_value = uniform(50, 100)
+            trend = uniform(-0.1, 0.1)  # Slight trend up or down
+            values = _series_values(base_value, trend, [uniform(-5, 5) for _ in range(_SERIES_DAYS)])
             
+            current_value, previous_value = values[-1], values[-2]
+            change_percent = round((current_value - previous_value) / previous_value * 100, 2)
             data[metric] = {
-                "current_value": time_series[-1]["value"],
-                "previous_value": time_series[-2]["value"],
-                "change_percent": round((time_series[-1]["value"] - time_series[-2]["value"]) / time_series[-2]["value"] * 100, 2),
-                "time_series": time_series
+                "current_value": current_value,
+                "previous_value": previous_value,
+                "change_percent": change_percent,
+                "time_series": [{"date": date, "value": value} for date, value in zip(dates, values)]
             }
+            stats.append((metric, change_percent, _week_change(values[-14:])))
         
-        return data
+        return data, self._insights_from_stats(category, stats)
+    
+    def _generate_monitoring_data(self, category: str, metrics: List[str]) -> Dict[str, Any]:
+        """
+        Generate monitoring data based on category and metrics.
+        
+        Args:
+            category: The monitoring category
+            metrics: The metrics to monitor
+            
+        Returns:
+            Dict containing the monitoring data
+        """
+        return self._build_monitoring_result(category, metrics)[0]
     
     def _generate_insights(self, category: str, data: Dict[str, Any]) -> List[str]:
         """
@@ -271,55 +414,76 @@ class MonitoringSkill(BaseSkill):
             data: The monitoring data
             
         Returns:
-            List of insights
+            List of at most 5 insights
+        """
+        stats = []
+        for metric, metric_data in data.items():
+            # Trends need at least a week of time series
+            time_series = metric_data["time_series"]
+            week_change = 0.0
+            if len(time_series) >= 7:
+                week_change = _week_change([point["value"] for point in time_series[-14:]])
+            stats.append((metric, metric_data["change_percent"], week_change))
+        
+        return self._insights_from_stats(category, stats)
+    
+    def _insights_from_stats(self, category: str, stats: List[Tuple[str, float, float]]) -> List[str]:
+        """
+        Generate insights from monitoring statistics.
+        
+        Args:
+            category: The monitoring category
+            stats: (metric, day-over-day change %, week-over-week change %) per metric
+            
+        Returns:
+            List of at most 5 insights
+        """
+        # Only the insights that are kept get formatted
+        return list(itertools.islice(self._iter_insights(category, stats), 5))
+    
+    def _iter_insights(self, category: str, stats: List[Tuple[str, float, float]]) -> Iterator[str]:
         """
-        insights = []
+        Yield insights lazily: the general category insights, then the metric-specific ones.
         
+        Args:
+            category: The monitoring category
+            stats: (metric, day-over-day change %, week-over-week change %) per metric
+            
+        Yields:
+            Insight strings
+        """
         # Generate general category insights
         if category == "financial_inclusion":
-            insights.append("Financial inclusion metrics show steady improvement in underserved regions")
-            insights.append("Digital banking adoption continues to be a key driver of inclusion")
-            insights.append("Gender gap in financial access is narrowing but still significant")
+            yield "Financial inclusion metrics show steady improvement in underserved regions"
+            yield "Digital banking adoption continues to be a key driver of inclusion"
+            yield "Gender gap in financial access is narrowing but still significant"
         elif category == "system_performance":
-            insights.append("System performance remains stable with minor fluctuations")
-            insights.append("Peak usage times are shifting to earlier in the day")
-            insights.append("Error rates are within acceptable thresholds")
+            yield "System performance remains stable with minor fluctuations"
+            yield "Peak usage times are shifting to earlier in the day"
+            yield "Error rates are within acceptable thresholds"
         elif category == "user_engagement":
-            insights.append("User engagement shows seasonal patterns with higher activity mid-week")
-            insights.append("New feature adoption is exceeding expectations")
-            insights.append("Retention metrics indicate strong user loyalty")
+            yield "User engagement shows seasonal patterns with higher activity mid-week"
+            yield "New feature adoption is exceeding expectations"
+            yield "Retention metrics indicate strong user loyalty"
         elif category == "market_trends":
-            insights.append("Market competition is intensifying in the digital finance space")
-            insights.append("Regulatory changes are creating new market opportunities")
-            insights.append("Consumer preferences are shifting toward integrated financial services")
+            yield "Market competition is intensifying in the digital finance space"
+            yield "Regulatory changes are creating new market opportunities"
+            yield "Consumer preferences are shifting toward integrated financial services"
         elif category == "regulatory_compliance":
-            insights.append("Compliance metrics are meeting or exceeding requirements")
-            insights.append("Recent regulatory changes require attention in Q2")
-            insights.append("Industry-wide compliance standards are becoming more stringent")
+            yield "Compliance metrics are meeting or exceeding requirements"
+            yield "Recent regulatory changes require attention in Q2"
+            yield "Industry-wide compliance standards are becoming more stringent"
         
         # Generate metric-specific insights
-        for metric, metric_data in data.items():
-            change = metric_data["change_percent"]
+        for metric, change, week_change in stats:
+            pretty = _METRIC_PRETTY.get(metric) or metric.replace('_', ' ').title()
             if change > 5:
-                insights.append(f"{metric.replace('_', ' ').title()} has increased significantly by {change}%")
+                yield _INCREASE_INSIGHT.format(pretty, change)
             elif change < -5:
-                insights.append(f"{metric.replace('_', ' ').title()} has decreased significantly by {abs(change)}%")
+                yield _DECREASE_INSIGHT.format(pretty, abs(change))
             
-            # Check for trends in time series
-            time_series = metric_data["time_series"]
-            if len(time_series) >= 7:
-                recent_week = [point["value"] for point in time_series[-7:]]
-                previous_week = [point["value"] for point in time_series[-14:-7]]
-                
-                recent_avg = sum(recent_week) / len(recent_week)
-                previous_avg = sum(previous_week) / len(previous_week)
-                
-                week_change = (recent_avg - previous_avg) / previous_avg * 100
-                
-                if week_change > 10:
-                    insights.append(f"{metric.replace('_', ' ').title()} shows strong positive trend over the past week (+{round(week_change, 1)}%)")
-                elif week_change < -10:
-                    insights.append(f"{metric.replace('_', ' ').title()} shows concerning negative trend over the past week ({round(week_change, 1)}%)")
-        
-        # Limit to 5 most important insights
-        return insights[:5]
+            # Check for trends over the past week
+            if week_change > 10:
+                yield _POSITIVE_TREND_INSIGHT.format(pretty, round(week_change, 1))
+            elif week_change < -10:
+                yield _NEGATIVE_TREND_INSIGHT.format(pretty, round(week_change, 1))
@@ -4,19 +4,55 @@ Research Skill Module for Agent Garden
 This module provides research capabilities to agents.
 """
 
+import re
 import logging
 import random
 import time
 from typing import Dict, Any, List, Optional
-from .base_skill import BaseSkill
+from .base_skill import BaseSkill, simulate_latency, SIMULATED_DELAY_SECONDS
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers are configured by the application entry point
 logger = logging.getLogger(__name__)
 
+# Private generator for simulated results, so draws skip the shared module-level state
+_RNG = random.Random()
+
+# Description keywords and tags that mark a task as research
+_RESEARCH_KEYWORDS = ("research", "investigate", "analyze", "study", "explore")
+_RESEARCH_KEYWORD_RE = re.compile("|".join(_RESEARCH_KEYWORDS))
+_RESEARCH_TAGS = frozenset(["research", "investigation", "analysis"])
+
+# Simulated findings by topic area
+_AI_ETHICS_FINDINGS = (
+    "Recent papers emphasize the importance of transparency in AI decision-making",
+    "Several companies have established independent ethics boards to oversee AI development",
+    "Regulatory frameworks for AI are being developed in the EU, US, and China",
+    "Bias mitigation techniques are becoming more sophisticated but challenges remain",
+    "Public awareness of AI ethics issues has increased significantly in the past year"
+)
+
+_FINANCIAL_INCLUSION_FINDINGS = (
+    "Mobile banking adoption has increased by 30% in developing regions",
+    "Microfinance initiatives show promising results in rural communities",
+    "Digital identity solutions are helping to bring banking to the unbanked",
+    "Regulatory sandboxes are enabling fintech innovation in financial inclusion",
+    "Alternative credit scoring models are expanding access to credit"
+)
+
+# Filled with the research topic
+_GENERAL_FINDING_TEMPLATES = (
+    "Initial research on {topic} shows promising avenues for further investigation",
+    "Expert consensus on {topic} is still developing, with diverse perspectives",
+    "Recent developments in {topic} highlight the need for continued monitoring",
+    "Comparative analysis reveals regional differences in approaches to {topic}",
+    "Historical trends in {topic} suggest cyclical patterns worth noting"
+)
+
 class ResearchSkill(BaseSkill):
     """Skill for conducting research on various topics."""
     
+    NAME = "research"
+    
     def __init__(self, name: str = "research", description: str = "Conducts research on specified topics"):
         """Initialize the research skill."""
         super().__init__(name, description)
@@ -46,11 +82,12 @@ class ResearchSkill(BaseSkill):
             }
         
         topic = task.get("description", "").replace("Research ", "")
-        logger.info(f"Conducting research on: {topic}")
+        logger.info("Conducting research on: %s", topic)
         
         # In a real implementation, this would use web APIs, databases, etc.
-        # For now, we'll simulate research with a delay and random findings
-        time.sleep(1)  # Simulate research time
+        # For now, we'll simulate research with random findings
+        if simulate_latency():
+            time.sleep(SIMULATED_DELAY_SECONDS)  # Simulate research time
         
         # Simulate research findings
         findings = self._simulate_research_findings(topic)
@@ -59,8 +96,8 @@ class ResearchSkill(BaseSkill):
             "success": True,
             "topic": topic,
             "findings": findings,
-            "sources_consulted": random.sample(self.sources, k=min(3, len(self.sources))),
-            "confidence": random.uniform(0.7, 0.95)
+            "sources_consulted": _RNG.sample(self.sources, k=min(3, len(self.sources))),
+            "confidence": _RNG.uniform(0.7, 0.95)
         }
     
     def validate_task(self, task: Dict[str, Any]) -> bool:
@@ -79,21 +116,27 @@ class ResearchSkill(BaseSkill):
         
         # Check if the task description indicates research
         description = task.get("description", "").lower()
-        research_keywords = ["research", "investigate", "analyze", "study", "explore"]
         
         # Check if any tags indicate research
         tags = task.get("tags", [])
-        research_tags = ["research", "investigation", "analysis"]
         
         return (
-            any(keyword in description for keyword in research_keywords) or
-            any(tag in tags for tag in research_tags)
+            _RESEARCH_KEYWORD_RE.search(description) is not None or
+            not _RESEARCH_TAGS.isdisjoint(tags)
         )
     
     def get_aliases(self) -> List[str]:
         """Get aliases for the research skill."""
         return ["investigate", "analyze", "study", "explore"]
     
+    def get_keyword_triggers(self) -> List[str]:
+        """Get the description keywords that indicate research."""
+        return list(_RESEARCH_KEYWORDS)
+    
+    def get_tag_triggers(self) -> List[str]:
+        """Get the tags that indicate research."""
+        return list(_RESEARCH_TAGS)
+    
     def _simulate_research_findings(self, topic: str) -> List[str]:
         """
         Simulate research findings for a topic.
@@ -106,34 +149,13 @@ class ResearchSkill(BaseSkill):
         """
         # In a real implementation, this would use actual research methods
         # For now, we'll return simulated findings
-        ai_ethics_findings = [
-            "Recent papers emphasize the importance of transparency in AI decision-making",
-            "Several companies have established independent ethics boards to oversee AI development",
-            "Regulatory frameworks for AI are being developed in the EU, US, and China",
-            "Bias mitigation techniques are becoming more sophisticated but challenges remain",
-            "Public awareness of AI ethics issues has increased significantly in the past year"
-        ]
-        
-        financial_inclusion_findings = [
-            "Mobile banking adoption has increased by 30% in developing regions",
-            "Microfinance initiatives show promising results in rural communities",
-            "Digital identity solutions are helping to bring banking to the unbanked",
-            "Regulatory sandboxes are enabling fintech innovation in financial inclusion",
-            "Alternative credit scoring models are expanding access to credit"
-        ]
-        
-        general_findings = [
-            f"Initial research on {topic} shows promising avenues for further investigation",
-            f"Expert consensus on {topic} is still developing, with diverse perspectives",
-            f"Recent developments in {topic} highlight the need for continued monitoring",
-            f"Comparative analysis reveals regional differences in approaches to {topic}",
-            f"Historical trends in {topic} suggest cyclical patterns worth noting"
-        ]
+        topic_lower = topic.lower()
         
         # Choose findings based on the topic
-        if "ethics" in topic.lower() or "ai" in topic.lower():
-            return random.sample(ai_ethics_findings, k=min(3, len(ai_ethics_findings)))
-        elif "financial" in topic.lower() or "inclusion" in topic.lower():
-            return random.sample(financial_inclusion_findings, k=min(3, len(financial_inclusion_findings)))
+        if "ethics" in topic_lower or "ai" in topic_lower:
+            return _RNG.sample(_AI_ETHICS_FINDINGS, k=min(3, len(_AI_ETHICS_FINDINGS)))
+        elif "financial" in topic_lower or "inclusion" in topic_lower:
+            return _RNG.sample(_FINANCIAL_INCLUSION_FINDINGS, k=min(3, len(_FINANCIAL_INCLUSION_FINDINGS)))
         else:
-            return random.sample(general_findings, k=min(3, len(general_findings)))
+            templates = _RNG.sample(_GENERAL_FINDING_TEMPLATES, k=min(3, len(_GENERAL_FINDING_TEMPLATES)))
+            return [template.format(topic=topic) for template in templates]
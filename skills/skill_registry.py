@@ -5,16 +5,44 @@ This module manages the registration and discovery of skills.
 """
 
 import os
+import re
 import importlib
-import inspect
 import logging
-from typing import Dict, List, Any, Type, Optional
+from typing import Dict, List, Any, Type, Optional, Callable, Set
 from .base_skill import BaseSkill
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers are configured by the application entry point
 logger = logging.getLogger(__name__)
 
+def _skill_class_name(skill_class: Type[BaseSkill]) -> str:
+    """
+    Get the registry name of a skill class without instantiating it.
+    
+    Uses the class's NAME attribute, falling back to the snake_case class
+    name without its "Skill" suffix (e.g. ContentCreationSkill -> content_creation).
+    
+    Args:
+        skill_class: The skill class
+        
+    Returns:
+        The skill's registry name
+    """
+    name = getattr(skill_class, "NAME", None)
+    if name:
+        return name
+    class_name = skill_class.__name__
+    if class_name.endswith("Skill") and class_name != "Skill":
+        class_name = class_name[:-len("Skill")]
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
+
+def _all_subclasses(cls: type) -> List[type]:
+    """Return every direct and indirect subclass of cls."""
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_all_subclasses(subclass))
+    return subclasses
+
 class SkillRegistry:
     """Registry for managing and discovering skills."""
     
@@ -22,6 +50,15 @@ class SkillRegistry:
         """Initialize the skill registry."""
         self.skills = {}  # name -> skill instance
         self.skill_classes = {}  # name -> skill class
+        self.lazy_skills = {}  # name -> loader returning a skill instance, until first use
+        self._skill_order = []  # skill names in registration order, which sets dispatch priority
+        
+        # Indexes used by find_skill_for_task to avoid validating every skill
+        self._alias_index = {}  # alias -> names of skills with that alias
+        self._keyword_index = {}  # description keyword -> skill names
+        self._tag_index = {}  # tag -> skill names
+        self._indexed_skills = set()  # skills fully described by the keyword/tag indexes
+        self._keyword_re = None  # compiled lazily from the keyword index
     
     def register_skill(self, skill_class: Type[BaseSkill]) -> None:
         """
@@ -30,12 +67,38 @@ class SkillRegistry:
         Args:
             skill_class: The skill class to register
         """
-        # Create a temporary instance to get metadata
-        temp_instance = skill_class("temp", "temp")
-        name = temp_instance.name
-        
+        name = _skill_class_name(skill_class)
         self.skill_classes[name] = skill_class
-        logger.info(f"Registered skill class: {name}")
+        logger.debug("Registered skill class: %s", name)
+    
+    def register_instance(self, skill: BaseSkill) -> BaseSkill:
+        """
+        Register an already constructed skill and its class.
+        
+        Args:
+            skill: The skill instance to register
+            
+        Returns:
+            The registered skill instance
+        """
+        self.skill_classes[skill.name] = type(skill)
+        self.skills[skill.name] = skill
+        self._index_skill(skill.name, skill)
+        self._add_to_order(skill.name)
+        logger.info("Registered skill instance: %s", skill.name)
+        return skill
+    
+    def register_lazy(self, name: str, loader: Callable[[], BaseSkill]) -> None:
+        """
+        Register a skill that is imported and instantiated on first use.
+        
+        Args:
+            name: Name the skill will be registered under
+            loader: Callable returning the skill instance
+        """
+        self.lazy_skills[name] = loader
+        self._add_to_order(name)
+        logger.info("Registered lazy skill: %s", name)
     
     def instantiate_skill(self, name: str, *args, **kwargs) -> Optional[BaseSkill]:
         """
@@ -51,10 +114,12 @@ class SkillRegistry:
         if name in self.skill_classes:
             skill = self.skill_classes[name](*args, **kwargs)
             self.skills[name] = skill
-            logger.info(f"Instantiated skill: {name}")
+            self._index_skill(name, skill)
+            self._add_to_order(name)
+            logger.info("Instantiated skill: %s", name)
             return skill
         else:
-            logger.warning(f"Skill not found: {name}")
+            logger.warning("Skill not found: %s", name)
             return None
     
     def get_skill(self, name: str) -> Optional[BaseSkill]:
@@ -67,7 +132,10 @@ class SkillRegistry:
         Returns:
             The skill instance or None if not found
         """
-        return self.skills.get(name)
+        skill = self.skills.get(name)
+        if skill is None and name in self.lazy_skills:
+            skill = self.register_instance(self.lazy_skills.pop(name)())
+        return skill
     
     def get_all_skills(self) -> List[BaseSkill]:
         """
@@ -76,12 +144,33 @@ class SkillRegistry:
         Returns:
             List of all skill instances
         """
-        return list(self.skills.values())
+        # Load any skills that have not been used yet
+        for name in list(self.lazy_skills):
+            self.get_skill(name)
+        return [self.skills[name] for name in self._ordered_names() if name in self.skills]
+    
+    def _add_to_order(self, name: str) -> None:
+        """Record a skill name's registration position, keeping its first one."""
+        if name not in self._skill_order:
+            self._skill_order.append(name)
+    
+    def _ordered_names(self) -> List[str]:
+        """
+        Get every skill name in dispatch order.
+        
+        Returns:
+            Registered names in registration order, then any skills added to
+            self.skills directly
+        """
+        return self._skill_order + [name for name in self.skills if name not in self._skill_order]
     
     def discover_skills(self, skills_dir: str = None) -> List[str]:
         """
         Discover and register skills from a directory.
         
+        Skills in this package are read from the generated manifest
+        (see build_skill_manifest.py); other directories are scanned.
+        
         Args:
             skills_dir: Directory to search for skills, defaults to the 'skills' directory
             
@@ -89,36 +178,113 @@ class SkillRegistry:
             List of discovered skill names
         """
         if skills_dir is None:
-            # Default to the 'skills' directory in the same directory as this file
-            skills_dir = os.path.dirname(os.path.abspath(__file__))
+            return self._discover_from_manifest()
         
         discovered_skills = []
         
         # Get all Python files in the directory
         for filename in os.listdir(skills_dir):
-            if filename.endswith('.py') and filename != '__init__.py' and filename != 'base_skill.py' and filename != 'skill_registry.py':
+            if filename.endswith('.py') and filename not in ('__init__.py', '_manifest.py', 'base_skill.py', 'skill_registry.py'):
                 module_name = filename[:-3]  # Remove .py extension
                 
                 try:
                     # Import the module
                     module_path = f"skills.{module_name}"
-                    module = importlib.import_module(module_path)
+                    importlib.import_module(module_path)
                     
-                    # Find all classes in the module that are subclasses of BaseSkill
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and 
-                            issubclass(obj, BaseSkill) and 
-                            obj != BaseSkill):
+                    # Find the BaseSkill subclasses defined in the module
+                    for skill_class in _all_subclasses(BaseSkill):
+                        if (skill_class.__module__ == module_path and 
+                            skill_class not in self.skill_classes.values()):
                             
                             # Register the skill
-                            self.register_skill(obj)
-                            discovered_skills.append(name)
+                            self.register_skill(skill_class)
+                            discovered_skills.append(skill_class.__name__)
                             
                 except Exception as e:
-                    logger.error(f"Error discovering skill in {filename}: {str(e)}")
+                    logger.error("Error discovering skill in %s: %s", filename, e)
         
         return discovered_skills
     
+    def _discover_from_manifest(self) -> List[str]:
+        """
+        Register the skill classes listed in the generated skill manifest.
+        
+        Returns:
+            List of discovered skill names
+        """
+        from ._manifest import SKILL_MANIFEST
+        
+        discovered_skills = []
+        for module_path, class_name in SKILL_MANIFEST:
+            try:
+                skill_class = getattr(importlib.import_module(module_path), class_name)
+                self.register_skill(skill_class)
+                discovered_skills.append(class_name)
+            except Exception as e:
+                logger.error("Error loading skill %s from %s: %s", class_name, module_path, e)
+        
+        return discovered_skills
+    
+    def _index_skill(self, name: str, skill: BaseSkill) -> None:
+        """
+        Add a skill's aliases and keyword/tag triggers to the dispatch indexes.
+        
+        Args:
+            name: Name the skill is registered under
+            skill: The skill instance
+        """
+        # Drop entries from any skill previously registered under this name
+        for index in (self._alias_index, self._keyword_index, self._tag_index):
+            for names in index.values():
+                if name in names:
+                    names.remove(name)
+        self._indexed_skills.discard(name)
+        self._keyword_re = None
+        
+        for alias in skill.get_aliases():
+            self._alias_index.setdefault(alias, []).append(name)
+        
+        keywords = skill.get_keyword_triggers()
+        tags = skill.get_tag_triggers()
+        if keywords is None or tags is None:
+            # Triggers unknown, so the skill is validated for every task
+            return
+        
+        for keyword in keywords:
+            self._keyword_index.setdefault(keyword.lower(), []).append(name)
+        for tag in tags:
+            self._tag_index.setdefault(tag, []).append(name)
+        self._indexed_skills.add(name)
+    
+    def _candidate_skill_names(self, task: Dict[str, Any]) -> Set[str]:
+        """
+        Find the indexed skills whose keyword or tag triggers match a task.
+        
+        Args:
+            task: The task to match
+            
+        Returns:
+            Names of matching indexed skills
+        """
+        if self._keyword_re is None:
+            # Longest first, so each position reports its longest keyword;
+            # shorter keywords contained in a match are added from the index below
+            keywords = sorted((k for k in self._keyword_index if k), key=len, reverse=True)
+            self._keyword_re = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))") if keywords else False
+        
+        candidates = set()
+        if self._keyword_re:
+            for match in set(self._keyword_re.findall(task.get("description", "").lower())):
+                for keyword, names in self._keyword_index.items():
+                    if keyword in match:
+                        candidates.update(names)
+        
+        for tag in task.get("tags", []):
+            candidates.update(self._tag_index.get(tag, ()))
+        
+        return candidates
+    
     def find_skill_for_task(self, task: Dict[str, Any]) -> Optional[BaseSkill]:
         """
         Find a skill that can execute the given task.
@@ -138,15 +304,26 @@ class SkillRegistry:
                 return skill
             
             # If the specified skill doesn't exist or can't handle the task,
-            # try to find a skill with a matching alias
-            for skill in self.get_all_skills():
-                if skill_name in skill.get_aliases() and skill.validate_task(task):
+            # try to find a skill with a matching alias. A lazy skill's aliases
+            # are only known once it is loaded, so load skills in order until one matches.
+            for name in self._ordered_names():
+                skill = self.get_skill(name)
+                if name in self._alias_index.get(skill_name, ()) and skill and skill.validate_task(task):
                     return skill
         
-        # If no skill is specified or the specified skill isn't suitable,
-        # try all skills to see if any can handle the task
-        for skill in self.get_all_skills():
-            if skill.validate_task(task):
+        # If no skill is specified or the specified skill isn't suitable, try
+        # the skills whose triggers match the task, plus any unindexed skills.
+        # Skills not loaded yet have no index entries, so they are loaded and
+        # validated in order, stopping at the first that accepts the task.
+        candidates = self._candidate_skill_names(task)
+        for name in self._ordered_names():
+            if name in self.lazy_skills:
+                skill = self.get_skill(name)
+            elif name in candidates or name not in self._indexed_skills:
+                skill = self.skills.get(name)
+            else:
+                continue
+            if skill and skill.validate_task(task):
                 return skill
         
         return None
@@ -1,13 +1,20 @@
 import os
+import sys
+import asyncio
 from dotenv import load_dotenv
-from helpers.email_helper import send_email
+from helpers.email_helper import send_emails_async
 
 # Load environment variables
 load_dotenv()
 
+# Comma-separated list of recipients; each one is sent concurrently
+recipients = [r.strip() for r in os.getenv("RECIPIENT_EMAIL", "").split(",") if r.strip()]
+if not recipients:
+    sys.exit("RECIPIENT_EMAIL is not set; set it to one or more comma-separated addresses")
+
 # Test email
-send_email(
-    recipient=os.getenv("RECIPIENT_EMAIL"),
+asyncio.run(send_emails_async(
+    recipients,
     subject="Test Email from Agent Garden 🌱",
     body="Hello Ryan,\n\nThis is a test email from Aurora's communication system.\n\n- The Garden"
-)
+))